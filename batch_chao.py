@@ -0,0 +1,158 @@
+from typing import List, Sequence, Tuple
+from string import ascii_lowercase as alphabet
+
+import numpy as np
+
+from Chaocipher.chaocipher import permutation_tables
+
+
+class BatchRotorState:
+    def __init__(self, count: int, add_chars=[]):
+        """
+        N standard rotor pairs held as one (N, 2 * size) array of symbol codes. Columns [0, size) are the cipher rotor and
+        [size, 2 * size) the plain rotor, each with its zenith in the first column, so one gather moves both rotors of a
+        row. Every row starts as the alphabet plus add_chars on both rotors, like quick_chao.standard_rotor
+        :param count: number of rotor pairs
+        :param add_chars: extra symbols appended to both rotors
+        """
+        self.symbols: List[str] = list(alphabet) + list(add_chars)
+        self.codes = {symbol: code for code, symbol in enumerate(self.symbols)}
+        self.size = len(self.symbols)
+        self.rotor_pairs = np.tile(np.arange(self.size, dtype=np.uint8), (count, 2))
+
+    def to_codes(self, strings: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Converts a list of strings to a padded (N, max length) code array and an array of lengths
+        :param strings:
+        :return:
+        """
+        lengths = np.fromiter((len(string) for string in strings), dtype=np.intp, count=len(strings))
+        joined = "".join(strings)
+        if joined.isascii() and all(len(symbol) == 1 and symbol.isascii() for symbol in self.symbols):
+            lookup = np.full(128, -1, dtype=np.intp)
+            lookup[[ord(symbol) for symbol in self.symbols]] = np.arange(self.size)
+            flat = lookup[np.frombuffer(joined.encode("ascii"), dtype=np.uint8)]
+        else:
+            flat = np.fromiter((self.codes.get(symbol, -1) for symbol in joined), dtype=np.intp, count=len(joined))
+        if (flat < 0).any():
+            raise ValueError("string contains a character that is not on the rotors")
+        flat = flat.astype(np.uint8)
+        code_array = np.zeros((len(strings), lengths.max(initial=0)), dtype=np.uint8)
+        code_array[np.arange(code_array.shape[1]) < lengths[:, None]] = flat
+        return code_array, lengths
+
+    def to_strings(self, code_array: np.ndarray, lengths: np.ndarray) -> List[str]:
+        """
+        Inverse of to_codes
+        :param code_array:
+        :param lengths:
+        :return:
+        """
+        if all(len(symbol) == 1 and symbol.isascii() for symbol in self.symbols):
+            ordinals = np.array([ord(symbol) for symbol in self.symbols], dtype=np.uint8)
+            data, width = ordinals[code_array].tobytes(), code_array.shape[1]
+            return [data[row * width:row * width + length].decode("ascii") for row, length in enumerate(lengths)]
+        symbols = np.array(self.symbols, dtype=object)
+        return ["".join(symbols[row[:length]]) for row, length in zip(code_array, lengths)]
+
+
+def batch_traverse(rotors: BatchRotorState, code_array: np.ndarray, lengths: np.ndarray, is_crypt: bool = False) \
+        -> np.ndarray:
+    """
+    Encodes every row of code_array on its own rotor pair, the batched equivalent of encode_string from text index 0.
+    Rows are processed longest first so that the rows still running at step t are always a prefix of the batch; a row
+    stops moving once its own string is exhausted. Like statistical_chao.BatchDecoder.plain_slots, the rotor the input
+    is looked up on (plain when encoding, cipher when decoding) is carried as its inverse, the slot of every symbol, so
+    the ring index of a step is one lookup instead of a search of the rotor; the other rotor is carried as is, to read
+    the output from. Both are moved by one gather each.
+    :param rotors: Batch Rotor State, modified in place
+    :param code_array: (N, max length) symbol codes
+    :param lengths: length of each row's string
+    :param is_crypt: flag for whether the strings are ciphertext (decryption) or plaintext
+    :return: (N, max length) array of output codes
+    """
+    size = rotors.size
+    encode_cipher, encode_plain, _, _ = permutation_tables(size)
+    cipher_tables = np.array([list(table[:size]) for table in encode_cipher], dtype=np.intp)
+    plain_tables = np.array([list(table[:size]) for table in encode_plain], dtype=np.intp)
+    indexing_tables, output_tables = (cipher_tables, plain_tables) if is_crypt else (plain_tables, cipher_tables)
+    # index_moves[r * size + s] is the slot the symbol in slot s of the indexing rotor moves to with ring index r
+    index_moves = np.argsort(indexing_tables, axis=1).astype(np.uint8).ravel()
+    order = np.argsort(-lengths, kind="stable")
+    rotor_pairs = rotors.rotor_pairs[order]
+    text, sorted_lengths = code_array[order], lengths[order]
+    active_counts = np.searchsorted(-sorted_lengths, -np.arange(1, text.shape[1] + 1), side="right")
+    row_offsets = (np.arange(len(order)) * size)[:, None]
+    indexing_columns, output_columns = (slice(0, size), slice(size, None)) if is_crypt else \
+        (slice(size, None), slice(0, size))
+    index_slots = np.argsort(rotor_pairs[:, indexing_columns], axis=1).astype(np.uint8)
+    output_rotors = rotor_pairs[:, output_columns].copy()
+    output_slot = size - 1 if is_crypt else 0
+    # lookups[t, n] is where the slot of row n's symbol at step t sits in the flattened index_slots
+    lookups = np.ascontiguousarray((text + row_offsets).T)
+    output = np.zeros(lookups.shape, dtype=text.dtype)
+    flat_slots, flat_rotors = index_slots.ravel(), output_rotors.ravel()
+    ring_offsets = np.arange(size, dtype=np.intp)[:, None] * size
+    gather = np.empty(index_slots.shape, dtype=np.intp)
+    # The active rows only change where a row's string ends, so the views are taken once per run of equal counts
+    run_starts = np.flatnonzero(np.diff(active_counts, prepend=-1))
+    for run_start, run_end in zip(run_starts, list(run_starts[1:]) + [len(active_counts)]):
+        active = active_counts[run_start]
+        slots, moved_rotors, offsets, moves = index_slots[:active], output_rotors[:active], row_offsets[:active], \
+            gather[:active]
+        read_out = moved_rotors[:, output_slot]
+        for step_lookups, step_output in zip(lookups[run_start:run_end, :active], output[run_start:run_end, :active]):
+            ring_indexes = flat_slots[step_lookups]
+            np.add(ring_offsets[ring_indexes], slots, out=moves)
+            np.take(index_moves, moves, out=slots)
+            np.add(output_tables[ring_indexes], offsets, out=moves)
+            np.take(flat_rotors, moves, out=moved_rotors)
+            step_output[:] = read_out
+    rotor_pairs[:, indexing_columns] = np.argsort(index_slots, axis=1)
+    rotor_pairs[:, output_columns] = output_rotors
+    rotors.rotor_pairs[order] = rotor_pairs
+    result = np.empty_like(text)
+    result[order] = output.T
+    return result
+
+
+def keyed_rotors(keys: Sequence[str], add_chars=[]) -> BatchRotorState:
+    """
+    Builds one rotor pair per key, each permuted by its key the way quick_chao.quick_encode does
+    :param keys:
+    :param add_chars:
+    :return:
+    """
+    rotors = BatchRotorState(len(keys), add_chars)
+    batch_traverse(rotors, *rotors.to_codes(keys))
+    return rotors
+
+
+def batch_encode(keys: Sequence[str], strings: Sequence[str], add_chars=[]) -> List[str]:
+    """
+    Vectorized quick_encode: encodes strings[i] with keys[i] for every i at once
+    :param keys:
+    :param strings:
+    :param add_chars:
+    :return:
+    """
+    if len(keys) != len(strings):
+        raise ValueError("batch_encode needs exactly one key per string")
+    rotors = keyed_rotors(keys, add_chars)
+    code_array, lengths = rotors.to_codes(strings)
+    return rotors.to_strings(batch_traverse(rotors, code_array, lengths), lengths)
+
+
+def batch_decode(keys: Sequence[str], strings: Sequence[str], add_chars=[]) -> List[str]:
+    """
+    Vectorized quick_decode: decodes strings[i] with keys[i] for every i at once
+    :param keys:
+    :param strings:
+    :param add_chars:
+    :return:
+    """
+    if len(keys) != len(strings):
+        raise ValueError("batch_decode needs exactly one key per string")
+    rotors = keyed_rotors(keys, add_chars)
+    code_array, lengths = rotors.to_codes(strings)
+    return rotors.to_strings(batch_traverse(rotors, code_array, lengths, True), lengths)
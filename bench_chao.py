@@ -0,0 +1,378 @@
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from collections import deque
+from string import ascii_lowercase as alphabet
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+
+from Chaocipher.chaocipher import EXHIBIT_1_CRYPTEXT, EXHIBIT_1_PLAINTEXT, EXHIBIT_2_CRYPTEXT, EXHIBIT_2_PLAINTEXT, \
+    RotorState, SearchStats, crack_in_depth, crack_rotor, decode_string, encode_string, find_starting_position, \
+    verify_rotor
+
+try:
+    import numpy as np
+    from Chaocipher import statistical_chao
+except ImportError:
+    statistical_chao = None
+
+THROUGHPUT_LENGTHS = (100, 1000, 10000, 100000)
+CRACK_LENGTHS = (100, 300, 1000)
+ALPHABET_SIZES = (8, 16, 26)
+# Searches are limited by nodes rather than time so that node counts do not depend on the machine
+NODE_BUDGET = 200000
+# A deterministic result (node count, solved count) is flagged when it is worse than the baseline by more than this
+# fraction
+REGRESSION_THRESHOLD = 0.1
+# With a time threshold, a timed result is flagged when its fastest run is slower than the baseline's by more than that
+# fraction. Only results timed over at least TIMED_REPEATS runs of the same work are compared. Even the fastest of
+# several runs was seen to vary by 1.8x between back to back runs on a shared machine, so wall time is not checked by
+# default.
+TIMED_REPEATS = 5
+# Shortest time a single timing sample should take
+MIN_SAMPLE_SECONDS = 0.02
+PERCENTILES = (50, 90, 99)
+# (message length, number of messages, alphabet size) of the crack_in_depth cases: messages that alone are fitted by
+# many rotors, so that a crack of one of them rarely finds the key
+DEPTH_CASES = ((60, 4, 8), (30, 8, 16))
+STATISTICAL_LENGTHS = (100, 200, 400)
+# Restarts a statistical attack may use before it counts as unsolved
+STATISTICAL_RESTARTS = 8
+# Fraction of characters a statistical attack has to get right to count as solved; in a short text the rarest symbols
+# can stay swapped without changing the score
+SOLVED_ACCURACY = 0.9
+
+
+def random_rotor(rng: random.Random, symbols: str = alphabet) -> RotorState:
+    cipher, plain = list(symbols), list(symbols)
+    rng.shuffle(cipher)
+    rng.shuffle(plain)
+    return RotorState(0, deque(cipher), None, deque(plain), None)
+
+
+def random_text(rng: random.Random, length: int, alphabet_size: int) -> str:
+    """
+    A random text drawn from alphabet_size letters of the alphabet (chosen at random)
+    """
+    letters = rng.sample(alphabet, alphabet_size)
+    return "".join(rng.choice(letters) for _ in range(length))
+
+
+def copy_rotor(rotor: RotorState) -> RotorState:
+    return RotorState(rotor.text_index, rotor.cipher_rotor.copy(), None, rotor.plain_rotor.copy(), None)
+
+
+def percentiles(values: Sequence[float], points: Sequence[int] = PERCENTILES) -> Dict[str, float]:
+    """
+    Nearest rank percentiles
+    """
+    ordered = sorted(values)
+    if not ordered:
+        return {f"p{point}": 0.0 for point in points}
+    return {f"p{point}": ordered[min(len(ordered) - 1, max(0, -(-point * len(ordered) // 100) - 1))]
+            for point in points}
+
+
+def timings(values: Sequence[float]) -> Dict[str, float]:
+    """
+    percentiles plus the fastest run, which is the least noisy estimate of the cost of repeated work
+    """
+    return dict(percentiles(values), min=min(values) if values else 0.0)
+
+
+def time_calls(function: Callable[[], object], repeats: int) -> List[float]:
+    """
+    Seconds per call, over repeats samples. A call much shorter than MIN_SAMPLE_SECONDS is repeated within each sample
+    until the sample lasts about that long, so that timer resolution and scheduler noise do not dominate.
+    """
+    start = time.perf_counter()
+    function()
+    calls = max(1, int(MIN_SAMPLE_SECONDS / max(time.perf_counter() - start, 1e-9)))
+    times = list()
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(calls):
+            function()
+        times.append((time.perf_counter() - start) / calls)
+    return times
+
+
+def bench_throughput(rng: random.Random, lengths: Sequence[int], alphabet_sizes: Sequence[int], repeats: int) -> \
+        Dict[str, dict]:
+    """
+    encode_string and decode_string throughput in characters per second, from the median of repeats runs
+    """
+    results = dict()
+    for length in lengths:
+        for alphabet_size in alphabet_sizes:
+            key = random_rotor(rng)
+            plaintext = random_text(rng, length, alphabet_size)
+            final_rotor = copy_rotor(key)
+            cryptext = encode_string(plaintext, final_rotor)
+            encode_times = time_calls(lambda: encode_string(plaintext, copy_rotor(key)), repeats)
+            decode_times = time_calls(lambda: decode_string(cryptext, copy_rotor(final_rotor)), repeats)
+            for name, times in (("encode", encode_times), ("decode", decode_times)):
+                seconds = timings(times)
+                results[f"{name}/{length}/{alphabet_size}"] = {
+                    "chars_per_sec": length / seconds["p50"] if seconds["p50"] else 0.0, "seconds": seconds,
+                    "repeats": repeats}
+    return results
+
+
+def bench_crack_case(plaintext: str, cryptext: str, window_size: int, node_budget: int) -> dict:
+    """
+    Times find_starting_position and crack_rotor on one pair
+    """
+    start = time.perf_counter()
+    find_starting_position(plaintext, cryptext, window_size)
+    position_seconds = time.perf_counter() - start
+    stats = SearchStats(node_budget=node_budget)
+    start = time.perf_counter()
+    initial_rotor, _ = crack_rotor(plaintext, cryptext, window_size, stats=stats)
+    crack_seconds = time.perf_counter() - start
+    return {"start_position_seconds": position_seconds, "crack_seconds": crack_seconds, "nodes": stats.nodes,
+            "solved": initial_rotor is not None and verify_rotor(plaintext, cryptext, initial_rotor)}
+
+
+def summarize(runs: List[dict], repeats: int = 1) -> dict:
+    """
+    :param runs:
+    :param repeats: how many times each case was run, when the runs are repeats of the same cases
+    """
+    return {"runs": len(runs), "solved": sum(run["solved"] for run in runs), "repeats": repeats,
+            "crack_seconds": timings([run["crack_seconds"] for run in runs]),
+            "start_position_seconds": timings([run["start_position_seconds"] for run in runs]),
+            "nodes": percentiles([run["nodes"] for run in runs])}
+
+
+def bench_crack(rng: random.Random, lengths: Sequence[int], alphabet_sizes: Sequence[int], trials: int,
+                window_size: int, node_budget: int) -> Dict[str, dict]:
+    """
+    crack_rotor and find_starting_position latency and node counts over trials random key and text pairs for each
+    length and alphabet size
+    """
+    results = dict()
+    for length in lengths:
+        for alphabet_size in alphabet_sizes:
+            runs = list()
+            for _ in range(trials):
+                plaintext = random_text(rng, length, alphabet_size)
+                cryptext = encode_string(plaintext, random_rotor(rng))
+                runs.append(bench_crack_case(plaintext, cryptext, window_size, node_budget))
+            results[f"crack/{length}/{alphabet_size}"] = summarize(runs)
+    return results
+
+
+def bench_exhibits(node_budget: int, repeats: int = TIMED_REPEATS) -> Dict[str, dict]:
+    """
+    The fixed reference cases, each cracked repeats times: Exhibit 1 in full, and the first 52 characters of Exhibit 2
+    (which the cracker cannot yet solve in full) with a window of 8
+    """
+    cases = {"exhibit_1": (EXHIBIT_1_PLAINTEXT.lower(), EXHIBIT_1_CRYPTEXT.lower(), 6),
+             "exhibit_2/52": (EXHIBIT_2_PLAINTEXT[:52].lower(), EXHIBIT_2_CRYPTEXT[:52].lower(), 8)}
+    return {name: summarize([bench_crack_case(plaintext, cryptext, window_size, node_budget) for _ in range(repeats)],
+                            repeats)
+            for name, (plaintext, cryptext, window_size) in cases.items()}
+
+
+def bench_depth(rng: random.Random, cases: Sequence[Tuple[int, int, int]], trials: int, node_budget: int) -> \
+        Dict[str, dict]:
+    """
+    crack_in_depth against a crack_rotor of the first message alone, on the same messages from the same key. A crack
+    counts as solved when its rotor decrypts every message.
+    :param cases: (message length, number of messages, alphabet size)
+    """
+    results = dict()
+    for length, count, alphabet_size in cases:
+        runs = {"depth": list(), "depth_single": list()}
+        for _ in range(trials):
+            key = random_rotor(rng)
+            plaintexts = [random_text(rng, length, alphabet_size) for _ in range(count)]
+            messages = [(plaintext, encode_string(plaintext, copy_rotor(key))) for plaintext in plaintexts]
+            for name in runs:
+                stats = SearchStats(node_budget=node_budget)
+                start = time.perf_counter()
+                if name == "depth":
+                    initial_rotor = crack_in_depth(messages, stats=stats)
+                else:
+                    initial_rotor, _ = crack_rotor(*messages[0], stats=stats)
+                seconds = time.perf_counter() - start
+                runs[name].append({"crack_seconds": seconds, "nodes": stats.nodes,
+                                   "solved": initial_rotor is not None and
+                                   all(verify_rotor(plaintext, cryptext, initial_rotor)
+                                       for plaintext, cryptext in messages)})
+        for name, name_runs in runs.items():
+            results[f"{name}/{length}x{count}/{alphabet_size}"] = {
+                "runs": len(name_runs), "solved": sum(run["solved"] for run in name_runs),
+                "crack_seconds": timings([run["crack_seconds"] for run in name_runs]),
+                "nodes": percentiles([run["nodes"] for run in name_runs])}
+    return results
+
+
+def language_model(rng: random.Random, symbols: str, successors: int = 4) -> \
+        Tuple[List[str], List[float], Dict[str, List[str]]]:
+    """
+    A made up language for the statistical attack, so that the benchmark needs no corpus: symbol frequencies follow
+    Zipf's law, and each symbol has a few likely successors
+    :return: symbols by rank, their weights, and the successors of each symbol
+    """
+    ranked = rng.sample(symbols, len(symbols))
+    weights = [1 / rank for rank in range(1, len(symbols) + 1)]
+    return ranked, weights, {symbol: rng.choices(ranked, weights, k=successors) for symbol in symbols}
+
+
+def language_text(rng: random.Random, model: Tuple[List[str], List[float], Dict[str, List[str]]], length: int,
+                  stickiness: float = 0.7) -> str:
+    """
+    A text in a language_model language: with probability stickiness the next symbol is one of the successors of the
+    last, otherwise it is drawn by frequency
+    """
+    ranked, weights, successors = model
+    text = rng.choices(ranked, weights)
+    while len(text) < length:
+        text.append(rng.choice(successors[text[-1]]) if rng.random() < stickiness else rng.choices(ranked, weights)[0])
+    return "".join(text[:length])
+
+
+def bench_statistical_case(rng: random.Random, model: Tuple[List[str], List[float], Dict[str, List[str]]],
+                           table: "statistical_chao.NgramTable", length: int, known_cipher: bool, restarts: int) \
+        -> dict:
+    """
+    Runs restarts of the statistical attack on one key and text until one decodes at least SOLVED_ACCURACY of the
+    characters right, and times them
+    """
+    key = random_rotor(rng, table.symbols)
+    plaintext = language_text(rng, model, length)
+    cryptext = encode_string(plaintext, copy_rotor(key))
+    decoder = statistical_chao.BatchDecoder(cryptext, table.symbols)
+    cipher_rotor = "".join(key.cipher_rotor) if known_cipher else None
+    start = time.perf_counter()
+    accuracy, used = 0.0, 0
+    while used < restarts and accuracy < SOLVED_ACCURACY:
+        result = statistical_chao.restart(decoder, table, used, cipher_rotor)
+        accuracy = sum(guess == symbol for guess, symbol in zip(result.plaintext, plaintext)) / length
+        used += 1
+    return {"solve_seconds": time.perf_counter() - start, "restarts": used, "accuracy": accuracy,
+            "solved": accuracy >= SOLVED_ACCURACY}
+
+
+def bench_statistical(rng: random.Random, lengths: Sequence[int], trials: int, restarts: int) -> Dict[str, dict]:
+    """
+    Time to solution of the ciphertext only attack against message length: on 8 symbol rotors with nothing known, and
+    on 26 symbol rotors with the cipher rotor known. Also the throughput of BatchDecoder in candidate characters per
+    second, to compare with decode.
+    """
+    results = dict()
+    cases = (("ciphertext_only/8", alphabet[:8], False), ("known_cipher/26", alphabet, True))
+    for name, symbols, known_cipher in cases:
+        model = language_model(rng, symbols)
+        table = statistical_chao.NgramTable.from_text(language_text(rng, model, 100000), symbols)
+        for length in lengths:
+            runs = [bench_statistical_case(rng, model, table, length, known_cipher, restarts) for _ in range(trials)]
+            results[f"statistical/{name}/{length}"] = {
+                "runs": len(runs), "solved": sum(run["solved"] for run in runs),
+                "solve_seconds": timings([run["solve_seconds"] for run in runs]),
+                "restarts": percentiles([run["restarts"] for run in runs])}
+    for length in lengths:
+        cryptext = encode_string(random_text(rng, length, len(alphabet)), random_rotor(rng))
+        decoder = statistical_chao.BatchDecoder(cryptext)
+        generator = np.random.default_rng(rng.getrandbits(32))
+        rotors = statistical_chao.random_cipher_rotors(decoder.size, statistical_chao.BATCH_SIZE, generator)
+        seconds = timings(time_calls(lambda: decoder.decode(rotors, rotors[::-1]), TIMED_REPEATS))
+        results[f"batch_decode/{length}/{len(alphabet)}"] = {
+            "chars_per_sec": statistical_chao.BATCH_SIZE * length / seconds["p50"], "seconds": seconds,
+            "repeats": TIMED_REPEATS}
+    return results
+
+
+def run_benchmarks(seed: int = 0, quick: bool = False, node_budget: int = NODE_BUDGET) -> dict:
+    """
+    Runs the whole suite. Every random key and text comes from one generator seeded with seed, so two runs with the
+    same seed measure the same workload.
+    :param seed:
+    :param quick: fewer lengths, sizes and repeats, for a smoke test
+    :param node_budget: node limit for each crack
+    :return: the results, ready for json.dump
+    """
+    rng = random.Random(seed)
+    throughput_lengths = THROUGHPUT_LENGTHS[:2] if quick else THROUGHPUT_LENGTHS
+    crack_lengths = CRACK_LENGTHS[:1] if quick else CRACK_LENGTHS
+    alphabet_sizes = ALPHABET_SIZES[-1:] if quick else ALPHABET_SIZES
+    results = dict()
+    results.update(bench_throughput(rng, throughput_lengths, alphabet_sizes, 3 if quick else 7))
+    results.update(bench_crack(rng, crack_lengths, alphabet_sizes, 2 if quick else 5, 6, node_budget))
+    results.update(bench_exhibits(node_budget, 1 if quick else TIMED_REPEATS))
+    results.update(bench_depth(rng, DEPTH_CASES[:1] if quick else DEPTH_CASES, 2 if quick else 5, node_budget))
+    if statistical_chao is not None:
+        results.update(bench_statistical(rng, STATISTICAL_LENGTHS[:1] if quick else STATISTICAL_LENGTHS,
+                                         1 if quick else 3, STATISTICAL_RESTARTS))
+    return {"meta": {"seed": seed, "quick": quick, "node_budget": node_budget, "python": platform.python_version(),
+                     "machine": platform.machine(), "created": time.strftime("%Y-%m-%dT%H:%M:%S")},
+            "results": results}
+
+
+def compare(current: dict, baseline: dict, threshold: float = REGRESSION_THRESHOLD,
+            time_threshold: Optional[float] = None) -> List[str]:
+    """
+    Lists the results that are worse than the baseline. Node counts and solved counts do not depend on the machine or
+    its load, so they are held to threshold. Wall time is only compared when a time_threshold is given, and then only
+    for results timed over at least TIMED_REPEATS runs of the same work in both files, on the fastest run; the times
+    of single runs over random cases are reported but never flagged. Results missing from either side are skipped.
+    :param current:
+    :param baseline:
+    :param threshold: for the median node count and the solved count
+    :param time_threshold: for the fastest run of repeated timings, None to leave wall time out
+    :return: one line per regression
+    """
+    regressions = list()
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            continue
+        if "nodes" in result and result["nodes"]["p50"] > base["nodes"]["p50"] * (1 + threshold):
+            regressions.append(f"{name}: median nodes {result['nodes']['p50']:.4g}, was {base['nodes']['p50']:.4g}")
+        if "solved" in result and result["solved"] < base["solved"]:
+            regressions.append(f"{name}: solved {result['solved']} of {result['runs']}, was {base['solved']}")
+        if time_threshold is None or min(result.get("repeats", 1), base.get("repeats", 1)) < TIMED_REPEATS:
+            continue
+        for metric in ("seconds", "crack_seconds"):
+            if metric in result and "min" in base.get(metric, dict()) and \
+                    result[metric]["min"] > base[metric]["min"] * (1 + time_threshold):
+                regressions.append(f"{name}: fastest {metric} {result[metric]['min']:.4g}, was "
+                                   f"{base[metric]['min']:.4g}")
+    return regressions
+
+
+def main(arguments: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Chaocipher throughput and crack latency benchmarks")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--quick", action="store_true", help="a smaller run, for a smoke test")
+    parser.add_argument("--node-budget", type=int, default=NODE_BUDGET)
+    parser.add_argument("--output", help="write the results to this JSON file instead of stdout")
+    parser.add_argument("--baseline", help="a saved results file to compare against")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD,
+                        help="allowed fraction of extra nodes, and of fewer solved cracks")
+    parser.add_argument("--time-threshold", type=float,
+                        help="also check wall time: allowed fraction of extra time for results timed over repeated "
+                             "runs, on a quiet dedicated machine")
+    options = parser.parse_args(arguments)
+    current = run_benchmarks(options.seed, options.quick, options.node_budget)
+    if options.output:
+        with open(options.output, "w") as output_file:
+            json.dump(current, output_file, indent=2)
+    else:
+        json.dump(current, sys.stdout, indent=2)
+        print()
+    if options.baseline:
+        with open(options.baseline) as baseline_file:
+            regressions = compare(current, json.load(baseline_file), options.threshold, options.time_threshold)
+        for regression in regressions:
+            print("REGRESSION", regression, file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
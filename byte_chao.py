@@ -0,0 +1,157 @@
+from typing import Optional, Union
+from collections import deque
+import mmap
+import os
+
+from Chaocipher.chaocipher import RotorState, permutation_tables
+
+BYTE_ROTOR_SIZE = 256
+Buffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+
+def byte_rotor(key: bytes = b"") -> RotorState:
+    """
+    The byte mode counterpart of quick_chao.standard_rotor: both rotors hold the byte values 0 to 255 in order, then
+    are permuted by encoding key the way quick_chao.quick_encode does
+    :param key:
+    :return: a Rotor State at text index 0
+    """
+    rotor = RotorState(0, deque(range(BYTE_ROTOR_SIZE)), None, deque(range(BYTE_ROTOR_SIZE)), None)
+    if key:
+        codec = ByteCodec(rotor)
+        codec.process(key)
+        codec.store(rotor)
+        rotor.text_index = 0
+    return rotor
+
+
+class ByteCodec:
+    def __init__(self, rotor: RotorState, is_crypt: bool = False):
+        """
+        Encodes or decodes raw bytes with 256-slot rotors whose symbols are the byte values themselves. Each rotor is
+        held as a 256-byte table, the same layout as CompactRotor with the symbol code equal to the byte, so every byte
+        is one lookup, two precomputed gathers and one write into the output buffer, with no str objects or symbol
+        table. Like stream_chao.StreamCodec, decoding runs forward from the initial rotor. The rotor is copied, the
+        caller's RotorState is not modified.
+        :param rotor: Rotor State holding each of the byte values 0 to 255 once on each rotor
+        :param is_crypt: flag for whether the input is ciphertext (decoding) or plaintext (encoding)
+        """
+        if sorted(rotor.cipher_rotor) != list(range(BYTE_ROTOR_SIZE)) or \
+                sorted(rotor.plain_rotor) != list(range(BYTE_ROTOR_SIZE)):
+            raise ValueError("byte mode needs rotors holding each of the byte values 0 to 255 once")
+        self.cipher = bytes(rotor.cipher_rotor)
+        self.plain = bytes(rotor.plain_rotor)
+        self.text_index = rotor.text_index
+        self.is_crypt = is_crypt
+
+    def process(self, source: Buffer, target: Optional[Buffer] = None) -> Buffer:
+        """
+        Processes the next stretch of input. The output goes into target, which must be writable and at least as long
+        as source; it can be source itself to work in place.
+        :param source:
+        :param target: defaults to a new bytearray
+        :return: target
+        """
+        if target is None:
+            target = bytearray(memoryview(source).nbytes)
+        with memoryview(source) as source_buffer, memoryview(target) as target_buffer, \
+                source_buffer.cast("B") as source_view, target_buffer.cast("B") as target_view:
+            if target_view.readonly:
+                raise ValueError("the output buffer is read only")
+            if len(target_view) < len(source_view):
+                raise ValueError("the output buffer is shorter than the input")
+            self.run(source_view, target_view)
+        return target
+
+    def run(self, source_view: memoryview, target_view: memoryview) -> None:
+        encode_cipher, encode_plain, _, _ = permutation_tables(BYTE_ROTOR_SIZE)
+        cipher, plain = self.cipher, self.plain
+        if self.is_crypt:
+            for position, byte in enumerate(source_view):
+                ring_index = cipher.index(byte)
+                cipher = encode_cipher[ring_index].translate(cipher)
+                plain = encode_plain[ring_index].translate(plain)
+                target_view[position] = plain[-1]
+        else:
+            for position, byte in enumerate(source_view):
+                ring_index = plain.index(byte)
+                cipher = encode_cipher[ring_index].translate(cipher)
+                plain = encode_plain[ring_index].translate(plain)
+                target_view[position] = cipher[0]
+        self.cipher, self.plain = cipher, plain
+        self.text_index += len(source_view)
+
+    def store(self, rotor: RotorState) -> None:
+        """
+        Writes the rotor positions back into a RotorState, like CompactRotor.store
+        :param rotor:
+        :return:
+        """
+        rotor.cipher_rotor.clear()
+        rotor.cipher_rotor.extend(self.cipher)
+        rotor.plain_rotor.clear()
+        rotor.plain_rotor.extend(self.plain)
+        rotor.text_index = self.text_index
+
+
+def encode_bytes(data: Buffer, rotor: RotorState, target: Optional[Buffer] = None) -> Buffer:
+    """
+    Byte mode encode_string. The rotor is moved to the end of the data.
+    :param data:
+    :param rotor: Rotor State at the start of the data, see byte_rotor
+    :param target: writable buffer for the output, at least as long as data (data itself to encode in place);
+    defaults to a new bytearray
+    :return: target
+    """
+    codec = ByteCodec(rotor)
+    target = codec.process(data, target)
+    codec.store(rotor)
+    return target
+
+
+def decode_bytes(data: Buffer, rotor: RotorState, target: Optional[Buffer] = None) -> Buffer:
+    """
+    Byte mode decryption. Unlike decode_string it takes the rotor at the start of the ciphertext and runs forward,
+    moving the rotor to the end of the data.
+    :param data:
+    :param rotor: Rotor State at the start of the data
+    :param target: see encode_bytes
+    :return: target
+    """
+    codec = ByteCodec(rotor, True)
+    target = codec.process(data, target)
+    codec.store(rotor)
+    return target
+
+
+def process_file(source_path: str, rotor: RotorState, destination_path: Optional[str] = None, is_crypt: bool = False) \
+        -> ByteCodec:
+    """
+    Encodes or decodes a file of any kind through memory maps, so the file never has to be read into memory. Without
+    a destination, or with a destination that is the source file itself, the file is overwritten in place; otherwise
+    the destination is created (or truncated) at the size of the source and written through its own map.
+    :param source_path:
+    :param rotor: Rotor State at the start of the file
+    :param destination_path:
+    :param is_crypt: flag for whether the file is ciphertext (decoding) or plaintext (encoding)
+    :return: the codec after the whole file has been processed, positioned to continue after its end
+    """
+    codec = ByteCodec(rotor, is_crypt)
+    size = os.path.getsize(source_path)
+    if destination_path is not None and os.path.exists(destination_path) and \
+            os.path.samefile(source_path, destination_path):
+        destination_path = None
+    if destination_path is None:
+        if size:
+            with open(source_path, "r+b") as source, mmap.mmap(source.fileno(), size) as source_map:
+                codec.process(source_map, source_map)
+                source_map.flush()
+        return codec
+    with open(source_path, "rb") as source, open(destination_path, "w+b") as destination:
+        destination.truncate(size)
+        if size:
+            with mmap.mmap(source.fileno(), size, access=mmap.ACCESS_READ) as source_map, \
+                    mmap.mmap(destination.fileno(), size) as destination_map:
+                codec.process(source_map, destination_map)
+                destination_map.flush()
+    return codec
@@ -1,15 +1,20 @@
-from typing import List, Tuple, Optional, Deque, Set
-from collections import deque
-from string import ascii_lowercase as alphabet
-from copy import deepcopy
+from typing import Callable, Dict, Iterable, Iterator, List, Sequence, Tuple, Optional, Deque, Set
+from collections import deque, OrderedDict
+from array import array
+from bisect import bisect_left
+from copy import copy, deepcopy
 import itertools
+import json
+import time
 
-alphset = set(alphabet)
+# Number of slots on a standard rotor, and the symbol marking a slot the cracker has not filled yet
+ROTOR_SIZE = 26
+PLACEHOLDER = "#"
 
 
 class RotorState:
     def __init__(self, text_index: int, cipher: Optional[Deque[str]] = None, cipher_set: Optional[Set[str]] = None,
-                 plaintext: Optional[Deque[str]] = None, plain_set: Optional[Set[str]] = None):
+                 plaintext: Optional[Deque[str]] = None, plain_set: Optional[Set[str]] = None, size: int = ROTOR_SIZE):
         """
         A representation of the plaintext rotor and cipher rotor for a given point in an encryption, decryption, or cracking process
         :param text_index: index in plaintext string that will be encoded next
@@ -17,12 +22,17 @@ class RotorState:
         :param cipher_set: set of characters used on the cipher rotor
         :param plaintext: deque representation of plaintext rotor
         :param plain_set: set of characters used on the plaintext rotor
+        :param size: number of slots on each rotor when they start out empty; any number from 4 to 256
         """
-        self.cipher_rotor: deque[str] = cipher if cipher else deque("#" for _ in range(26))
+        self.cipher_rotor: deque[str] = cipher if cipher else deque(PLACEHOLDER for _ in range(size))
         self.cipher_set = cipher_set if cipher_set else set()
-        self.plain_rotor: deque[str] = plaintext if plaintext else deque("#" for _ in range(26))
+        self.plain_rotor: deque[str] = plaintext if plaintext else deque(PLACEHOLDER for _ in range(size))
         self.plain_set = plain_set if plain_set else set()
         self.text_index = text_index
+        self.checkpoints: Optional["CheckpointIndex"] = None
+        self.trail: Optional["SearchTrail"] = None
+        self.occurrences: Optional["OccurrenceIndex"] = None
+        self.stats: Optional["SearchStats"] = None
 
     def initialize_for_search(self, plaintext, cryptext, start_index):
         """
@@ -84,11 +94,12 @@ def encode_char(string: str, rotor: RotorState, is_crypt: bool = False) -> None:
     """
     indexing_rotor = rotor.cipher_rotor if is_crypt else rotor.plain_rotor
     ring_index: int = indexing_rotor.index(string[rotor.text_index])
+    nadir = len(indexing_rotor) // 2
     rotor.cipher_rotor.rotate(-ring_index)
     rotor.plain_rotor.rotate(-ring_index)
     rotor.plain_rotor.rotate(-1)
-    deque_insert(rotor.plain_rotor, 13, deque_pop(rotor.plain_rotor, 2))
-    deque_insert(rotor.cipher_rotor, 13, deque_pop(rotor.cipher_rotor, 1))
+    deque_insert(rotor.plain_rotor, nadir, deque_pop(rotor.plain_rotor, 2))
+    deque_insert(rotor.cipher_rotor, nadir, deque_pop(rotor.cipher_rotor, 1))
     rotor.text_index += 1
 
 
@@ -103,42 +114,608 @@ def decode_char(string: str, rotor: RotorState, is_crypt: bool = False) -> None:
     indexing_rotor = rotor.cipher_rotor if is_crypt else rotor.plain_rotor
     ring_index: int = indexing_rotor.index(string[rotor.text_index - 1])
     rotation_offset = 0 if is_crypt else 1
+    nadir = len(indexing_rotor) // 2
     rotor.cipher_rotor.rotate(-(ring_index + rotation_offset))
     rotor.plain_rotor.rotate(-(ring_index + rotation_offset))
-    deque_insert(rotor.cipher_rotor, 1, deque_pop(rotor.cipher_rotor, 13))
+    deque_insert(rotor.cipher_rotor, 1, deque_pop(rotor.cipher_rotor, nadir))
     rotor.plain_rotor.rotate(1)
-    deque_insert(rotor.plain_rotor, 3, deque_pop(rotor.plain_rotor, 14))
+    deque_insert(rotor.plain_rotor, 3, deque_pop(rotor.plain_rotor, nadir + 1))
     rotor.text_index -= 1
 
 
+def permutation_tables(size: int) -> Tuple[List[bytes], List[bytes], List[bytes], List[bytes]]:
+    """
+    Builds (and caches) the gather tables used by CompactRotor. Entry r of each table is the complete permutation a rotor
+    of the given size undergoes when the ring index is r: the rotation to the zenith and the zenith/nadir moves fused
+    into one step. The tables are derived by running the deque operations of encode_char and decode_char on the slot
+    numbers themselves, so the two engines cannot drift apart. Each table is padded to 256 bytes so that it can be
+    applied with bytes.translate. When the rotor fits twice into those 256 bytes, bytes [size, 2 * size) repeat the
+    permutation for a block of slot labels that rides along with the rotor (see CheckpointIndex); the rest is the
+    identity. The nadir is slot size // 2, as in encode_char.
+    :param size: number of slots on each rotor
+    :return: encode cipher, encode plain, decode cipher and decode plain tables
+    """
+    if size in _permutation_cache:
+        return _permutation_cache[size]
+    if not 4 <= size <= 256:
+        raise ValueError(f"rotors need from 4 to 256 slots, not {size}")
+    nadir = size // 2
+    has_labels = 2 * size <= 256
+    padding = list(range(2 * size if has_labels else size, 256))
+
+    def table(slots: Deque[int]) -> bytes:
+        label_block = [size + slot for slot in slots] if has_labels else []
+        return bytes(list(slots) + label_block + padding)
+
+    encode_cipher, encode_plain, decode_cipher, decode_plain = [], [], [], []
+    for ring_index in range(size):
+        cipher_slots, plain_slots = deque(range(size)), deque(range(size))
+        cipher_slots.rotate(-ring_index)
+        plain_slots.rotate(-ring_index - 1)
+        deque_insert(plain_slots, nadir, deque_pop(plain_slots, 2))
+        deque_insert(cipher_slots, nadir, deque_pop(cipher_slots, 1))
+        encode_cipher.append(table(cipher_slots))
+        encode_plain.append(table(plain_slots))
+
+        cipher_slots, plain_slots = deque(range(size)), deque(range(size))
+        cipher_slots.rotate(-ring_index)
+        plain_slots.rotate(-ring_index)
+        deque_insert(cipher_slots, 1, deque_pop(cipher_slots, nadir))
+        plain_slots.rotate(1)
+        deque_insert(plain_slots, 3, deque_pop(plain_slots, nadir + 1))
+        decode_cipher.append(table(cipher_slots))
+        decode_plain.append(table(plain_slots))
+    _permutation_cache[size] = (encode_cipher, encode_plain, decode_cipher, decode_plain)
+    return _permutation_cache[size]
+
+
+_permutation_cache = dict()
+
+
+class CompactRotor:
+    __slots__ = ("size", "symbols", "codes", "cipher", "plain", "text_index")
+
+    def __init__(self, rotor: RotorState, symbols: Optional[List[str]] = None, codes: Optional[dict] = None):
+        """
+        A compact copy of a RotorState used to run long stretches of encoding or decoding. Each rotor is held as a
+        256-byte table of symbol codes with the zenith at 0, and every step is one symbol lookup plus one precomputed
+        gather per rotor (see permutation_tables) instead of a series of deque rotations. Symbol codes are shared by
+        both rotors, so placeholders (PLACEHOLDER) survive the round trip.
+        :param rotor: Rotor State to copy
+        :param symbols: symbol table to share with other compact rotors, extended with any new symbols
+        :param codes: inverse of the shared symbol table
+        """
+        self.size = len(rotor.cipher_rotor)
+        if symbols is None:
+            self.symbols: List[str] = list(dict.fromkeys(itertools.chain(rotor.cipher_rotor, rotor.plain_rotor)))
+            self.codes = dict(zip(self.symbols, range(len(self.symbols))))
+        else:
+            self.symbols, self.codes = symbols, codes
+            for symbol in itertools.chain(rotor.cipher_rotor, rotor.plain_rotor):
+                if symbol not in codes:
+                    codes[symbol] = len(symbols)
+                    symbols.append(symbol)
+        padding = bytes(range(self.size, 256))
+        self.cipher = bytes(map(self.codes.__getitem__, rotor.cipher_rotor)) + padding
+        self.plain = bytes(map(self.codes.__getitem__, rotor.plain_rotor)) + padding
+        self.text_index = rotor.text_index
+
+    def copy(self) -> "CompactRotor":
+        """
+        An independent copy sharing the (immutable) rotor tables and the symbol table, so it costs a few attribute
+        assignments however large the rotors are
+        :return:
+        """
+        duplicate = CompactRotor.__new__(CompactRotor)
+        duplicate.size, duplicate.symbols, duplicate.codes = self.size, self.symbols, self.codes
+        duplicate.cipher, duplicate.plain, duplicate.text_index = self.cipher, self.plain, self.text_index
+        return duplicate
+
+    def encode(self, string: str, steps: int, is_crypt: bool = False, string_offset: int = 0) -> List[str]:
+        """
+        Equivalent to calling encode_char steps times, returning the characters encode_string would have emitted. The
+        rotor is left unchanged if a character cannot be found.
+        :param string:
+        :param steps:
+        :param is_crypt:
+        :param string_offset: text index of string[0], for strings that are a slice of the full text
+        :return:
+        """
+        encode_cipher, encode_plain, _, _ = permutation_tables(self.size)
+        symbols, cipher, plain, size = self.symbols, self.cipher, self.plain, self.size
+        codes, output_list = self.codes, list()
+        try:
+            for i in range(self.text_index, self.text_index + steps):
+                ring_index = (cipher if is_crypt else plain).index(codes[string[i - string_offset]], 0, size)
+                cipher = encode_cipher[ring_index].translate(cipher)
+                plain = encode_plain[ring_index].translate(plain)
+                output_list.append(symbols[plain[size - 1]] if is_crypt else symbols[cipher[0]])
+        except KeyError as error:
+            raise ValueError(f"{error.args[0]!r} is not in deque") from None
+        self.cipher, self.plain = cipher, plain
+        self.text_index += steps
+        return output_list
+
+    def decode(self, string: str, steps: int, is_crypt: bool = True) -> List[str]:
+        """
+        Equivalent to calling decode_char steps times, returning the emitted characters in the order they are produced
+        (last character first)
+        :param string:
+        :param steps:
+        :param is_crypt:
+        :return:
+        """
+        _, _, decode_cipher, decode_plain = permutation_tables(self.size)
+        symbols, cipher, plain, size = self.symbols, self.cipher, self.plain, self.size
+        rotation_offset = 0 if is_crypt else 1
+        codes, output_list = self.codes, list()
+        try:
+            for i in range(self.text_index - 1, self.text_index - steps - 1, -1):
+                ring_index = ((cipher if is_crypt else plain).index(codes[string[i]], 0, size) + rotation_offset) % size
+                cipher = decode_cipher[ring_index].translate(cipher)
+                plain = decode_plain[ring_index].translate(plain)
+                output_list.append(symbols[plain[0]] if is_crypt else symbols[cipher[0]])
+        except KeyError as error:
+            raise ValueError(f"{error.args[0]!r} is not in deque") from None
+        self.cipher, self.plain = cipher, plain
+        self.text_index -= steps
+        return output_list
+
+    def store(self, rotor: RotorState) -> None:
+        """
+        Writes the rotor positions back into a RotorState, keeping its deques and sets
+        :param rotor:
+        :return:
+        """
+        rotor.cipher_rotor.clear()
+        rotor.cipher_rotor.extend(map(self.symbols.__getitem__, self.cipher[:self.size]))
+        rotor.plain_rotor.clear()
+        rotor.plain_rotor.extend(map(self.symbols.__getitem__, self.plain[:self.size]))
+        rotor.text_index = self.text_index
+
+
+class CheckpointIndex:
+    def __init__(self, rotor: RotorState, interval: int = 1024, max_checkpoints: int = 4096):
+        """
+        Rotor snapshots every interval characters of one text, so that traverse_to can start from the nearest
+        checkpoint instead of walking the whole distance. Checkpoints are recorded lazily by the walks made through
+        seek, and the least recently used ones are evicted beyond max_checkpoints (each costs roughly 2 * size bytes
+        plus dictionary overhead).
+
+        A checkpoint does not store rotor contents. It stores, for every slot, which slot of the anchor rotor (the rotor
+        the index was built from) the symbol there came from; these labels are carried through the walk by
+        permutation_tables. Contents are read from the anchor through the labels, and seek refreshes the anchor from the
+        rotor being moved, so a partially filled rotor in the cracker can keep filling in slots without invalidating
+        anything. The labels only depend on where the characters already traversed sit, so an index stays valid for
+        every rotor that descends from the one it was built with; branches of a search should each get a copy(), unless
+        the index holds the search's SearchTrail: that records the checkpoints the index adds and evicts and keeps its
+        anchor contents at each mark, so that undo puts both back.
+        :param rotor: anchor Rotor State
+        :param interval: distance between checkpoints
+        :param max_checkpoints: memory budget in number of checkpoints
+        """
+        if 2 * len(rotor.cipher_rotor) > 256:
+            raise ValueError("CheckpointIndex needs rotors of at most 128 slots")
+        self.interval = interval
+        self.max_checkpoints = max_checkpoints
+        self.symbols: List[str] = list()
+        self.codes = dict()
+        anchor = CompactRotor(rotor, self.symbols, self.codes)
+        self.size = anchor.size
+        self.anchor_index = anchor.text_index
+        self.anchor_cipher = bytearray(256)
+        self.anchor_cipher[self.size:2 * self.size] = anchor.cipher[:self.size]
+        self.anchor_plain = bytearray(256)
+        self.anchor_plain[self.size:2 * self.size] = anchor.plain[:self.size]
+        self.checkpoints: "OrderedDict[int, Tuple[bytes, bytes]]" = OrderedDict()
+        self.trail: Optional["SearchTrail"] = None
+        self.record(anchor)
+
+    def copy(self) -> "CheckpointIndex":
+        index_copy = copy(self)
+        index_copy.anchor_cipher = self.anchor_cipher.copy()
+        index_copy.anchor_plain = self.anchor_plain.copy()
+        index_copy.checkpoints = self.checkpoints.copy()
+        return index_copy
+
+    def record(self, compact_rotor: CompactRotor) -> None:
+        size = self.size
+        if self.trail is not None:
+            self.trail.record_checkpoint(compact_rotor.text_index, self.checkpoints.get(compact_rotor.text_index))
+        self.checkpoints[compact_rotor.text_index] = (compact_rotor.cipher[size:2 * size],
+                                                      compact_rotor.plain[size:2 * size])
+        self.checkpoints.move_to_end(compact_rotor.text_index)
+        while len(self.checkpoints) > self.max_checkpoints:
+            text_index, labels = self.checkpoints.popitem(last=False)
+            if self.trail is not None:
+                self.trail.record_checkpoint(text_index, labels)
+
+    def restore(self, text_index: int) -> CompactRotor:
+        """
+        Rebuilds the compact rotor at a checkpoint from the anchor
+        :param text_index:
+        :return:
+        """
+        cipher_labels, plain_labels = self.checkpoints[text_index]
+        self.checkpoints.move_to_end(text_index)
+        compact_rotor = CompactRotor.__new__(CompactRotor)
+        compact_rotor.size, compact_rotor.symbols, compact_rotor.codes = self.size, self.symbols, self.codes
+        padding = bytes(range(2 * self.size, 256))
+        compact_rotor.cipher = cipher_labels.translate(self.anchor_cipher) + cipher_labels + padding
+        compact_rotor.plain = plain_labels.translate(self.anchor_plain) + plain_labels + padding
+        compact_rotor.text_index = text_index
+        return compact_rotor
+
+    def nearest(self, from_index: int, to_index: int) -> Optional[int]:
+        """
+        The checkpoint closest to from_index on the way to to_index, or None if there are none in between
+        :param from_index:
+        :param to_index:
+        :return:
+        """
+        step = self.interval if to_index > from_index else -self.interval
+        candidate = from_index - from_index % self.interval
+        if candidate != from_index and step > 0:
+            candidate += self.interval
+        best = self.anchor_index if self.anchor_index in self.checkpoints and \
+            min(from_index, to_index) <= self.anchor_index <= max(from_index, to_index) else None
+        while min(from_index, to_index) <= candidate <= max(from_index, to_index):
+            if candidate in self.checkpoints:
+                if best is None or abs(candidate - from_index) < abs(best - from_index):
+                    best = candidate
+                break
+            candidate += step
+        return best
+
+    def walk(self, string: str, compact_rotor: CompactRotor, target_index: int, is_crypt: bool) -> None:
+        """
+        Moves a compact rotor restored from a checkpoint to the target, recording checkpoints on the way
+        :param string:
+        :param compact_rotor:
+        :param target_index:
+        :param is_crypt:
+        :return:
+        """
+        while compact_rotor.text_index != target_index:
+            if target_index > compact_rotor.text_index:
+                next_index = min(target_index, compact_rotor.text_index - compact_rotor.text_index % self.interval +
+                                 self.interval)
+                compact_rotor.encode(string, next_index - compact_rotor.text_index, is_crypt)
+            else:
+                next_index = max(target_index, compact_rotor.text_index - 1 -
+                                 (compact_rotor.text_index - 1) % self.interval)
+                compact_rotor.decode(string, compact_rotor.text_index - next_index, is_crypt)
+            if next_index % self.interval == 0:
+                self.record(compact_rotor)
+
+    def refresh_anchor(self, string: str, rotor: RotorState, target_index: int, is_crypt: bool, placeholder: int) \
+            -> None:
+        """
+        Copies what a partially filled rotor knows into the anchor, by walking a copy of it to the checkpoint nearest to
+        it on the way to the target
+        :param string:
+        :param rotor:
+        :param target_index:
+        :param is_crypt:
+        :param placeholder: code of PLACEHOLDER
+        :return:
+        """
+        near_rotor = self.nearest(rotor.text_index, target_index)
+        size = self.size
+        current = CompactRotor(rotor, self.symbols, self.codes)
+        if near_rotor > current.text_index:
+            current.encode(string, near_rotor - current.text_index, is_crypt)
+        else:
+            current.decode(string, current.text_index - near_rotor, is_crypt)
+        # A step only fixes the rotors up to a joint rotation (which one depends on its direction), so the walked rotor
+        # is lined up with the checkpoint on a symbol they both know before its contents go into the anchor
+        checkpoint = self.restore(near_rotor)
+        offset = 0
+        for slot in range(size):
+            if checkpoint.cipher[slot] != placeholder:
+                offset = current.cipher.index(checkpoint.cipher[slot], 0, size) - slot
+                break
+        cipher_labels, plain_labels = self.checkpoints[near_rotor]
+        for slot in range(size):
+            self.anchor_cipher[cipher_labels[slot]] = current.cipher[(slot + offset) % size]
+            self.anchor_plain[plain_labels[slot]] = current.plain[(slot + offset) % size]
+
+    def seek(self, string: str, target_index: int, rotor: RotorState, is_crypt: bool = False) -> bool:
+        """
+        Moves the rotor to the target through the nearest checkpoints. A partially filled rotor first has its contents
+        copied into the anchor (see refresh_anchor), then the checkpoint nearest to the target is restored and walked
+        the rest of the way. Both walks cover part of the direct path, so they never need a character that traverse_to
+        would not.
+        :param string:
+        :param target_index:
+        :param rotor:
+        :param is_crypt:
+        :return: False, leaving the rotor untouched, if there is no checkpoint between the rotor and the target
+        """
+        near_target = self.nearest(target_index, rotor.text_index)
+        if near_target is None:
+            return False
+        placeholder = self.codes.get(PLACEHOLDER)
+        if placeholder is not None:
+            self.refresh_anchor(string, rotor, target_index, is_crypt, placeholder)
+        forward = target_index > rotor.text_index
+        compact_rotor = self.restore(near_target)
+        if near_target == target_index:
+            # make the last step in the same direction as traverse_to would, so the rotation matches
+            self.walk(string, compact_rotor, target_index - 1 if forward else target_index + 1, is_crypt)
+        self.walk(string, compact_rotor, target_index, is_crypt)
+        compact_rotor.store(rotor)
+        return True
+
+    def save(self, path: str) -> None:
+        state = {"interval": self.interval, "max_checkpoints": self.max_checkpoints, "symbols": self.symbols,
+                 "size": self.size, "anchor_index": self.anchor_index, "anchor_cipher": self.anchor_cipher.hex(),
+                 "anchor_plain": self.anchor_plain.hex(),
+                 "checkpoints": [[text_index, cipher_labels.hex(), plain_labels.hex()]
+                                 for text_index, (cipher_labels, plain_labels) in self.checkpoints.items()]}
+        with open(path, "w") as index_file:
+            json.dump(state, index_file)
+
+    @classmethod
+    def load(cls, path: str) -> "CheckpointIndex":
+        with open(path) as index_file:
+            state = json.load(index_file)
+        index = cls.__new__(cls)
+        index.interval, index.max_checkpoints = state["interval"], state["max_checkpoints"]
+        index.symbols = state["symbols"]
+        index.codes = {symbol: code for code, symbol in enumerate(index.symbols)}
+        index.size, index.anchor_index = state["size"], state["anchor_index"]
+        index.anchor_cipher = bytearray.fromhex(state["anchor_cipher"])
+        index.anchor_plain = bytearray.fromhex(state["anchor_plain"])
+        index.checkpoints = OrderedDict((text_index, (bytes.fromhex(cipher_labels), bytes.fromhex(plain_labels)))
+                                        for text_index, cipher_labels, plain_labels in state["checkpoints"])
+        return index
+
+
+class SearchTrail:
+    def __init__(self):
+        """
+        An undo log for a search that works on a single Rotor State. Each mark keeps the rotor's wheels and sets as they
+        are, and undo puts them back, so the children of a search node share one copy taken when the node branches
+        instead of each copying the rotor, and the slot writes and set insertions made under a guess need no record.
+        Undoing a move by traversing back would cost as much as the move itself, so the wheels are kept rather than
+        the moves. A CheckpointIndex holding the trail records the checkpoints it adds and evicts, and the mark keeps
+        its anchor contents too.
+        """
+        self.entries: List[tuple] = list()
+
+    def mark(self, rotor: RotorState) -> int:
+        checkpoints = rotor.checkpoints if rotor.checkpoints is not None and rotor.checkpoints.trail is self else None
+        self.entries.append(("mark", rotor.text_index, tuple(rotor.cipher_rotor), tuple(rotor.plain_rotor),
+                             tuple(rotor.cipher_set), tuple(rotor.plain_set),
+                             None if checkpoints is None else bytes(checkpoints.anchor_cipher),
+                             None if checkpoints is None else bytes(checkpoints.anchor_plain)))
+        return len(self.entries) - 1
+
+    def record_checkpoint(self, text_index: int, labels: Optional[Tuple[bytes, bytes]]) -> None:
+        """
+        Records the labels a checkpoint held before it was recorded or evicted, None if there was none
+        """
+        self.entries.append(("checkpoint", text_index, labels))
+
+    def undo(self, rotor: RotorState, mark: int) -> None:
+        """
+        Reverts the rotor, and its CheckpointIndex if that holds the trail, to the state they were in when mark was
+        taken. The mark itself stays, so the same mark can be undone to again.
+        :param rotor:
+        :param mark:
+        :return:
+        """
+        entries = self.entries
+        if len(entries) > mark + 1:
+            for entry in reversed(entries[mark + 1:]):
+                if entry[0] == "mark":
+                    continue
+                if entry[2] is None:
+                    del rotor.checkpoints.checkpoints[entry[1]]
+                else:
+                    rotor.checkpoints.checkpoints[entry[1]] = entry[2]
+            del entries[mark + 1:]
+        _, rotor.text_index, cipher, plain, cipher_set, plain_set, anchor_cipher, anchor_plain = entries[mark]
+        rotor.cipher_rotor.clear()
+        rotor.cipher_rotor.extend(cipher)
+        rotor.plain_rotor.clear()
+        rotor.plain_rotor.extend(plain)
+        rotor.cipher_set.clear()
+        rotor.cipher_set.update(cipher_set)
+        rotor.plain_set.clear()
+        rotor.plain_set.update(plain_set)
+        if anchor_cipher is not None:
+            rotor.checkpoints.anchor_cipher[:] = anchor_cipher
+            rotor.checkpoints.anchor_plain[:] = anchor_plain
+
+
+# How far decide_direction looks for a pinned pair in each direction
+DIRECTION_HORIZON = 64
+
+
+class OccurrenceIndex:
+    def __init__(self, plaintext: str, cryptext: str, horizon: int = DIRECTION_HORIZON):
+        """
+        A per-text index built once per crack, so that decide_direction can find the nearest pinned pair (a position
+        whose plaintext and cryptext characters are both on the rotors already) without scanning the text character by
+        character. Both texts are held as byte strings of symbol codes. A rotor set becomes a 256-byte membership
+        table, and a window of either text is tested against it with one bytes.translate; the two results are combined
+        as integers, so the nearest position where both texts hit is read off the lowest set bit.
+        :param plaintext:
+        :param cryptext:
+        :param horizon: the largest distance searched for a pinned pair
+        """
+        self.codes = {symbol: code for code, symbol in enumerate(dict.fromkeys(itertools.chain(plaintext, cryptext)))}
+        if len(self.codes) > 256:
+            raise ValueError("OccurrenceIndex needs texts of at most 256 distinct symbols")
+        self.plain_codes = bytes(map(self.codes.__getitem__, plaintext))
+        self.cipher_codes = bytes(map(self.codes.__getitem__, cryptext))
+        self.length = len(plaintext)
+        self.horizon = horizon
+
+    def membership(self, symbols: Set[str], extra: str) -> bytearray:
+        table = bytearray(256)
+        for symbol in symbols:
+            code = self.codes.get(symbol)
+            if code is not None:
+                table[code] = 1
+        table[self.codes[extra]] = 1
+        return table
+
+    def pinned_distance(self, position: int, forward: bool, plain_table: bytearray, cipher_table: bytearray) -> int:
+        """
+        Distance from position to the nearest pinned pair at or beyond it, in the given direction
+        :param position:
+        :param forward:
+        :param plain_table: membership table of the plaintext rotor's symbols
+        :param cipher_table: membership table of the cipher rotor's symbols
+        :return: the distance, or horizon if there is none within it
+        """
+        if forward:
+            window = slice(position, min(position + self.horizon, self.length))
+        else:
+            window = slice(max(position - self.horizon + 1, 0), max(position + 1, 0))
+        byteorder = "little" if forward else "big"
+        pinned = int.from_bytes(self.plain_codes[window].translate(plain_table), byteorder) & \
+            int.from_bytes(self.cipher_codes[window].translate(cipher_table), byteorder)
+        return ((pinned & -pinned).bit_length() - 1) // 8 if pinned else self.horizon
+
+
+class SearchAborted(Exception):
+    pass
+
+
+class SearchStats:
+    def __init__(self, node_budget: Optional[int] = None, time_limit: Optional[float] = None,
+                 progress: Optional[Callable[["SearchStats"], Optional[bool]]] = None, progress_interval: int = 1000):
+        """
+        Counters, phase timings and limits for one search. Pass one to crack, crack_iterative or crack_rotor and it
+        rides along on the rotor like the other search aids; without one the search only pays for a few None checks.
+        A search that runs out of nodes or time, or whose progress callback returns False, stops cleanly: crack returns
+        None and aborted holds the reason.
+        :param node_budget: largest number of nodes to expand
+        :param time_limit: wall clock limit in seconds, counted from the start of the search
+        :param progress: called with this object every progress_interval nodes
+        :param progress_interval:
+        """
+        self.node_budget = node_budget
+        self.time_limit = time_limit
+        self.progress = progress
+        self.progress_interval = progress_interval
+        self.nodes = 0
+        self.dead_ends = 0
+        self.backtracks = 0
+        self.forced_fills = 0
+        self.traversals = 0
+        self.traverse_steps = 0
+        self.children: List[int] = list()
+        self.branching_nodes: List[int] = list()
+        self.phase_times = {"start_position": 0.0, "settle": 0.0, "branch": 0.0}
+        self.search_range = (0, 0)
+        self.coverage = 0.0
+        self.max_coverage = 0.0
+        self.started: Optional[float] = None
+        self.deadline = float("inf")
+        self.elapsed = 0.0
+        self.aborted: Optional[str] = None
+
+    def start(self) -> None:
+        self.started = time.perf_counter()
+        if self.time_limit is not None:
+            self.deadline = self.started + self.time_limit
+
+    def stop(self) -> None:
+        self.elapsed = time.perf_counter() - self.started
+
+    def node(self, search_range: SearchRange, text_length: int) -> None:
+        """
+        Counts a node and enforces the limits
+        """
+        if self.node_budget is not None and self.nodes >= self.node_budget:
+            self.abort("node budget")
+        self.nodes += 1
+        self.search_range = (search_range.start, search_range.end)
+        self.coverage = (search_range.end - search_range.start) / text_length
+        self.max_coverage = max(self.max_coverage, self.coverage)
+        if time.perf_counter() > self.deadline:
+            self.abort("time limit")
+        if self.progress is not None and self.nodes % self.progress_interval == 0:
+            if self.progress(self) is False:
+                self.abort("progress callback")
+
+    def branched(self, depth: int, children: int) -> None:
+        while len(self.children) <= depth:
+            self.children.append(0)
+            self.branching_nodes.append(0)
+        self.children[depth] += children
+        self.branching_nodes[depth] += 1
+
+    def abort(self, reason: str) -> None:
+        self.aborted = reason
+        raise SearchAborted(reason)
+
+    def branching_factor(self) -> List[float]:
+        """
+        The average number of children of a branching node, by depth
+        """
+        return [children / nodes if nodes else 0.0 for children, nodes in zip(self.children, self.branching_nodes)]
+
+    def as_dict(self) -> dict:
+        elapsed = self.elapsed
+        if self.started is not None and not elapsed:
+            elapsed = time.perf_counter() - self.started
+        return {"nodes": self.nodes, "dead_ends": self.dead_ends, "backtracks": self.backtracks,
+                "forced_fills": self.forced_fills, "traversals": self.traversals,
+                "traverse_steps": self.traverse_steps, "branching_factor": self.branching_factor(),
+                "phase_times": dict(self.phase_times), "elapsed": elapsed, "search_range": list(self.search_range),
+                "coverage": self.coverage, "max_coverage": self.max_coverage, "aborted": self.aborted}
+
+
+# Below this many steps copying into a CompactRotor costs more than stepping the deques directly
+COMPACT_TRAVERSE_THRESHOLD = 48
+
+
 def encode_string(string: str, rotor: RotorState, is_crypt: bool = False) -> str:
     """
-    Encodes a plaintext string given a rotor state.
+    Encodes a plaintext string given a rotor state. Strings shorter than COMPACT_TRAVERSE_THRESHOLD are stepped on
+    the deques, longer ones through a CompactRotor.
     :param string:
     :param rotor:
     :param is_crypt:
     :return:
     """
-    output_list = list()
-    for i in range(len(string)):
-        encode_char(string, rotor, is_crypt)
-        output_list.append(rotor.plain_rotor[-1] if is_crypt else rotor.cipher_rotor[0])
+    if len(string) < COMPACT_TRAVERSE_THRESHOLD:
+        output_list = list()
+        for i in range(len(string)):
+            encode_char(string, rotor, is_crypt)
+            output_list.append(rotor.plain_rotor[-1] if is_crypt else rotor.cipher_rotor[0])
+        return "".join(output_list)
+    compact_rotor = CompactRotor(rotor)
+    output_list = compact_rotor.encode(string, len(string), is_crypt)
+    compact_rotor.store(rotor)
     output_string = "".join(output_list)
     return output_string
 
 
 def decode_string(string: str, rotor: RotorState, is_crypt: bool = True) -> str:
     """
-    Decodes an encrypted string or outputs ciphertext in reverse
+    Decodes an encrypted string or outputs ciphertext in reverse. Like encode_string, short strings are stepped on the
+    deques.
     :param string:
     :param rotor:
     :param is_crypt:
     :return:
     """
-    output_list = list()
-    while rotor.text_index > 0:
-        decode_char(string, rotor, is_crypt)
-        output_list.append(rotor.plain_rotor[0] if is_crypt else rotor.cipher_rotor[0])
+    if rotor.text_index < COMPACT_TRAVERSE_THRESHOLD:
+        output_list = list()
+        while rotor.text_index > 0:
+            decode_char(string, rotor, is_crypt)
+            output_list.append(rotor.plain_rotor[0] if is_crypt else rotor.cipher_rotor[0])
+        return "".join(output_list)[::-1]
+    compact_rotor = CompactRotor(rotor)
+    output_list = compact_rotor.decode(string, max(rotor.text_index, 0), is_crypt)
+    compact_rotor.store(rotor)
     output_string = "".join(output_list)
     return output_string[::-1]
 
@@ -146,7 +723,7 @@ def decode_string(string: str, rotor: RotorState, is_crypt: bool = True) -> str:
 def traverse_to(string: str, target_index: int, rotor: RotorState, is_crypt: bool = False) -> None:
     """
     Brings the rotor to a target position in the enciphering process. Used primarily when executing the dfs and filling
-    in values
+    in values. Long moves go through the rotor's checkpoint index when it has one.
     :param string:
     :param target_index:
     :param rotor:
@@ -154,6 +731,20 @@ def traverse_to(string: str, target_index: int, rotor: RotorState, is_crypt: boo
     :return:
     """
     decrease = True if rotor.text_index > target_index else False
+    if rotor.stats is not None:
+        rotor.stats.traversals += 1
+        rotor.stats.traverse_steps += abs(rotor.text_index - target_index)
+    if rotor.checkpoints is not None and abs(rotor.text_index - target_index) > rotor.checkpoints.interval:
+        if rotor.checkpoints.seek(string, target_index, rotor, is_crypt):
+            return
+    if abs(rotor.text_index - target_index) >= COMPACT_TRAVERSE_THRESHOLD:
+        compact_rotor = CompactRotor(rotor)
+        if decrease:
+            compact_rotor.decode(string, rotor.text_index - target_index, is_crypt)
+        else:
+            compact_rotor.encode(string, target_index - rotor.text_index, is_crypt)
+        compact_rotor.store(rotor)
+        return
     while rotor.text_index != target_index:
         if decrease:
             decode_char(string, rotor, is_crypt)
@@ -161,18 +752,55 @@ def traverse_to(string: str, target_index: int, rotor: RotorState, is_crypt: boo
             encode_char(string, rotor, is_crypt)
 
 
-def crack(plaintext: str, cryptext: str, start_index: int) -> Optional[RotorState]:
+def decode_range(cryptext: str, start: int, end: int, rotor: RotorState) -> str:
+    """
+    Decodes cryptext[start:end] from a rotor anywhere in the text (usually the initial rotor), moving the rotor to end.
+    Give the rotor a CheckpointIndex to make repeated slices of a long text cheap.
+    :param cryptext:
+    :param start:
+    :param end:
+    :param rotor:
+    :return:
+    """
+    traverse_to(cryptext, start, rotor, True)
+    compact_rotor = CompactRotor(rotor)
+    output_list = compact_rotor.encode(cryptext, end - start, True)
+    compact_rotor.store(rotor)
+    return "".join(output_list)
+
+
+def crack(plaintext: str, cryptext: str, start_index: int, checkpoint_interval: Optional[int] = None,
+          stats: Optional[SearchStats] = None, size: int = ROTOR_SIZE) -> Optional[RotorState]:
     """
     Function that runs the depth first search to crack the rotor from a plaintext and ciphertext from a given position
     Initializes the rotor to 1 step after the encryption of the start index
     :param plaintext:
     :param cryptext:
     :param start_index:
-    :return:
+    :param checkpoint_interval: if given, the search keeps a CheckpointIndex with this interval for its traversals
+    :param stats: if given, the search is counted and limited by this SearchStats
+    :param size: number of slots on each rotor
+    :return: the completed rotor, or None if there is none or the search was aborted
     """
-    rotor = RotorState(start_index)
+    rotor = RotorState(start_index, size=size)
     rotor.initialize_for_search(plaintext, cryptext, start_index)
-    return dfs(plaintext, cryptext, rotor, SearchRange(start_index, start_index + 1), 0)
+    if checkpoint_interval is not None:
+        rotor.checkpoints = CheckpointIndex(rotor, checkpoint_interval)
+    rotor.occurrences = OccurrenceIndex(plaintext, cryptext)
+    rotor.stats = stats
+    if stats is not None:
+        stats.start()
+    try:
+        completed = dfs(plaintext, cryptext, rotor, SearchRange(start_index, start_index + 1), 0)
+    except SearchAborted:
+        completed = None
+    finally:
+        if stats is not None:
+            stats.stop()
+    if completed is not None:
+        completed.occurrences = None
+        completed.stats = None
+    return completed
 
 
 def dfs(plaintext: str, cryptext: str, rotor_state: RotorState, search_range: SearchRange, stack_depth: int) -> \
@@ -186,62 +814,367 @@ Optional[RotorState]:
     :param cryptext:
     :param rotor_state:
     :param search_range:
-    :param stack_depth: Used primarily for debugging
+    :param stack_depth: depth of the node, for the search stats
     :return:
     """
+    settled = settle(plaintext, cryptext, rotor_state, search_range)
+    if settled is None:
+        return None
+    if settled:
+        return rotor_state
+    for new_rotor, new_search_range in branches(plaintext, cryptext, rotor_state, search_range, stack_depth):
+        completed = dfs(plaintext, cryptext, new_rotor, new_search_range, stack_depth + 1)
+        if completed:
+            return completed
+    if rotor_state.stats is not None:
+        rotor_state.stats.backtracks += 1
+    return rotor_state if is_complete(rotor_state) else None
+    # instead: return None?
+
+
+def settle(plaintext: str, cryptext: str, rotor_state: RotorState, search_range: SearchRange) -> Optional[bool]:
+    """
+    The first half of a dfs node: fills in everything the current guesses force and checks for completeness
+    :param plaintext:
+    :param cryptext:
+    :param rotor_state:
+    :param search_range:
+    :return: None if the guesses lead to a contradiction, True if the rotor is complete, False if it needs branching
+    """
+    stats = rotor_state.stats
+    if stats is None:
+        return fill_forced(plaintext, cryptext, rotor_state, search_range)
+    stats.node(search_range, len(plaintext))
+    phase_start = time.perf_counter()
+    settled = fill_forced(plaintext, cryptext, rotor_state, search_range)
+    stats.phase_times["settle"] += time.perf_counter() - phase_start
+    if settled is None:
+        stats.dead_ends += 1
+    return settled
+
+
+def fill_forced(plaintext: str, cryptext: str, rotor_state: RotorState, search_range: SearchRange) -> Optional[bool]:
+    """
+    The body of settle, without the search stats
+    """
     while check_function(plaintext, cryptext, rotor_state, search_range):
-        # print(f"The search range is {search_range.end - search_range.start} wide and the stack is  {stack_depth} tall")
         if not fill_in(plaintext, cryptext, rotor_state, search_range):
             return None
-    if rotor_state.plain_set == alphset and rotor_state.cipher_set == alphset:
-        return rotor_state
+    if is_complete(rotor_state):
+        return True
     if search_range.end == len(plaintext) and search_range.start == 0:
-        return rotor_state
+        return True
+    return False
+
+
+def branches(plaintext: str, cryptext: str, rotor_state: RotorState, search_range: SearchRange, depth: int = 0) -> \
+Iterator[Tuple[RotorState, SearchRange]]:
+    """
+    The second half of a dfs node: lazily generates a child for every open position of the next character pair, in the
+    order dfs visits them. The rotor state is moved to the branching position on the first call to next().
+    :param plaintext:
+    :param cryptext:
+    :param rotor_state: a settled Rotor State
+    :param search_range:
+    :param depth: depth of the node, for the search stats
+    :return:
+    """
+    stats = rotor_state.stats
+    phase_start = time.perf_counter() if stats is not None else 0.0
     traverse_position = decide_direction(plaintext, cryptext, rotor_state, search_range)
     search_position = traverse_position - 1 if traverse_position == search_range.start else traverse_position
     traverse_to(plaintext, traverse_position, rotor_state)
-    for positions in find_open_positions(rotor_state, traverse_position == search_range.start):
+    open_positions = find_open_positions(rotor_state, traverse_position == search_range.start)
+    if stats is not None:
+        stats.phase_times["branch"] += time.perf_counter() - phase_start
+        stats.branched(depth, len(open_positions))
+    for positions in open_positions:
         new_rotor = RotorState(rotor_state.text_index, rotor_state.cipher_rotor.copy(), rotor_state.cipher_set.copy(),
                                rotor_state.plain_rotor.copy(), rotor_state.plain_set.copy())
+        if rotor_state.checkpoints is not None:
+            new_rotor.checkpoints = rotor_state.checkpoints.copy()
+        new_rotor.occurrences = rotor_state.occurrences
+        new_rotor.stats = stats
         new_rotor.cipher_rotor[positions[0]], new_rotor.plain_rotor[positions[1]] = cryptext[search_position], \
                                                                                     plaintext[search_position]
         new_rotor.cipher_set.add(cryptext[search_position])
         new_rotor.plain_set.add(plaintext[search_position])
-        new_search_range = search_range.copy()
-        completed = dfs(plaintext, cryptext, new_rotor, new_search_range, stack_depth + 1)
-        if completed:
+        yield new_rotor, search_range.copy()
+
+
+def crack_iterative(plaintext: str, cryptext: str, start_index: int, checkpoint_interval: Optional[int] = None,
+                    stats: Optional[SearchStats] = None, size: int = ROTOR_SIZE) -> Optional[RotorState]:
+    """
+    Same as crack, but runs iterative_dfs on a single Rotor State with a SearchTrail instead of copying the rotor for
+    every branch. Returns the same rotor as crack.
+    :param plaintext:
+    :param cryptext:
+    :param start_index:
+    :param checkpoint_interval: see crack
+    :param stats: see crack
+    :param size: see crack
+    :return:
+    """
+    rotor = RotorState(start_index, size=size)
+    rotor.initialize_for_search(plaintext, cryptext, start_index)
+    rotor.trail = SearchTrail()
+    if checkpoint_interval is not None:
+        rotor.checkpoints = CheckpointIndex(rotor, checkpoint_interval)
+        rotor.checkpoints.trail = rotor.trail
+    rotor.occurrences = OccurrenceIndex(plaintext, cryptext)
+    rotor.stats = stats
+    if stats is not None:
+        stats.start()
+    try:
+        completed = iterative_dfs(plaintext, cryptext, rotor, SearchRange(start_index, start_index + 1))
+    except SearchAborted:
+        completed = None
+    finally:
+        if stats is not None:
+            stats.stop()
+    if rotor.checkpoints is not None:
+        rotor.checkpoints.trail = None
+    rotor.trail = None
+    rotor.occurrences = None
+    rotor.stats = None
+    return completed
+
+
+def iterative_dfs(plaintext: str, cryptext: str, rotor_state: RotorState, search_range: SearchRange) -> \
+Optional[RotorState]:
+    """
+    The dfs search without recursion, copying the rotor once per branching node instead of once per child. Each
+    branching node on the explicit stack keeps a trail mark taken after its traversal, the search range at that point
+    and its remaining open positions; the next child is made by undoing the trail back to the mark and placing the next
+    character pair. The search depth is bounded only by memory.
+    The rotor's CheckpointIndex, if any, holds the same trail, so the one index is shared by the whole search and undo
+    also takes back the checkpoints and anchor contents a refuted child left in it.
+    :param plaintext:
+    :param cryptext:
+    :param rotor_state: a Rotor State holding a SearchTrail, modified in place
+    :param search_range: modified in place
+    :return: the completed rotor_state, or None
+    """
+    trail = rotor_state.trail
+    settled = settle(plaintext, cryptext, rotor_state, search_range)
+    if settled is None:
+        return None
+    if settled:
+        return rotor_state
+    stack = [open_node(plaintext, cryptext, rotor_state, search_range)]
+    while stack:
+        mark, start, end, search_position, open_positions = stack[-1]
+        positions = next(open_positions, None)
+        if positions is None:
+            stack.pop()
+            if rotor_state.stats is not None:
+                rotor_state.stats.backtracks += 1
+            continue
+        trail.undo(rotor_state, mark)
+        search_range.start, search_range.end = start, end
+        rotor_state.cipher_rotor[positions[0]], rotor_state.plain_rotor[positions[1]] = cryptext[search_position], \
+                                                                                        plaintext[search_position]
+        rotor_state.cipher_set.add(cryptext[search_position])
+        rotor_state.plain_set.add(plaintext[search_position])
+        settled = settle(plaintext, cryptext, rotor_state, search_range)
+        if settled is None:
+            continue
+        if settled:
+            return rotor_state
+        stack.append(open_node(plaintext, cryptext, rotor_state, search_range, len(stack)))
+    return None
+
+
+def open_node(plaintext: str, cryptext: str, rotor_state: RotorState, search_range: SearchRange, depth: int = 0) -> \
+Tuple[int, int, int, int, Iterator[Tuple[int, int]]]:
+    """
+    Moves a settled rotor to its branching position, like branches, and returns the stack entry for iterative_dfs
+    :return: trail mark, search range start and end, text index of the next pair and an iterator over its open positions
+    """
+    stats = rotor_state.stats
+    phase_start = time.perf_counter() if stats is not None else 0.0
+    traverse_position = decide_direction(plaintext, cryptext, rotor_state, search_range)
+    search_position = traverse_position - 1 if traverse_position == search_range.start else traverse_position
+    traverse_to(plaintext, traverse_position, rotor_state)
+    open_positions = find_open_positions(rotor_state, traverse_position == search_range.start)
+    if stats is not None:
+        stats.phase_times["branch"] += time.perf_counter() - phase_start
+        stats.branched(depth, len(open_positions))
+    return rotor_state.trail.mark(rotor_state), search_range.start, search_range.end, search_position, \
+        iter(open_positions)
+
+
+def crack_in_depth(messages: Sequence[Tuple[str, str]], stats: Optional[SearchStats] = None, size: int = ROTOR_SIZE) \
+        -> Optional[RotorState]:
+    """
+    Cracks several plaintext/cryptext pairs that were all encrypted from the same initial rotor. The search keeps one
+    partially filled initial rotor for all of them, so everything one message forces is known to the others and a guess
+    that contradicts any message is dropped for all. Every message is searched forward from its first character.
+    This pays off when each message alone is fitted by many rotors (short messages, or few symbols); a message long
+    enough to pin the key down is better cracked on its own, see the depth cases of bench_chao.
+    :param messages: (plaintext, cryptext) pairs
+    :param stats: see crack
+    :param size: see crack
+    :return: the shared initial rotor (text index 0), verified against every message, or None
+    """
+    messages = [(plaintext, cryptext) for plaintext, cryptext in messages if plaintext or cryptext]
+    if not messages:
+        raise ValueError("crack_in_depth needs at least one non-empty message")
+    if any(len(plaintext) != len(cryptext) for plaintext, cryptext in messages):
+        raise ValueError("every plaintext must be as long as its cryptext")
+    plaintext, cryptext = messages[0]
+    rotor = RotorState(0, size=size)
+    rotor.initialize_for_search(plaintext, cryptext, 0)
+    traverse_to(plaintext, 0, rotor)
+    ends = [1] + [0] * (len(messages) - 1)
+    if stats is not None:
+        stats.start()
+    try:
+        settled = settle_messages(messages, rotor, ends)
+        completed = depth_dfs(messages, *settled, stats, 0) if settled is not None else None
+    except SearchAborted:
+        completed = None
+    finally:
+        if stats is not None:
+            stats.stop()
+    if completed is None or not all(verify_rotor(plaintext, cryptext, completed) for plaintext, cryptext in messages):
+        return None
+    return completed
+
+
+def depth_dfs(messages: List[Tuple[str, str]], initial_rotor: RotorState, rotors: List[RotorState], ends: List[int],
+              stats: Optional[SearchStats], depth: int) -> Optional[RotorState]:
+    """
+    The body of crack_in_depth, called on a settled node. Every open position for the next pair of every unfinished
+    message is tried and settled against all the messages, and the search branches on the message with the fewest
+    children that survive. A guess is cheap to refute once several messages check it, so looking one level ahead this
+    way prunes far more than it costs.
+    :param messages:
+    :param initial_rotor: the shared rotor at text index 0
+    :param rotors: each message's rotor at the end of its search range, see settle_messages
+    :param ends: for each message, the end of its search range (which always starts at 0)
+    :param stats:
+    :param depth:
+    :return:
+    """
+    if is_complete(initial_rotor) or all(end == len(plaintext) for end, (plaintext, _) in zip(ends, messages)):
+        return initial_rotor
+    text_length = sum(len(plaintext) for plaintext, _ in messages)
+    best_children = None
+    for message, (plaintext, _) in enumerate(messages):
+        if ends[message] == len(plaintext):
+            continue
+        children = list()
+        for child in message_children(messages, rotors[message], message, ends):
+            if stats is not None:
+                stats.node(SearchRange(0, sum(child[1])), text_length)
+            settled = settle_messages(messages, *child)
+            if settled is None:
+                if stats is not None:
+                    stats.dead_ends += 1
+                continue
+            children.append(settled)
+        if best_children is None or len(children) < len(best_children):
+            best_children = children
+        if not children:
+            break
+    if stats is not None:
+        stats.branched(depth, len(best_children))
+    for child_rotor, child_rotors, child_ends in best_children:
+        completed = depth_dfs(messages, child_rotor, child_rotors, child_ends, stats, depth + 1)
+        if completed is not None:
             return completed
-    return rotor_state if rotor_state.plain_set == alphset and rotor_state.cipher_set == alphset else None
-    # instead: return None?
+    if stats is not None:
+        stats.backtracks += 1
+    return None
+
+
+def message_children(messages: List[Tuple[str, str]], rotor: RotorState, message: int, ends: List[int]) -> \
+        Iterator[Tuple[RotorState, List[int]]]:
+    """
+    A child for every open position of the next pair of one message: the shared initial rotor with the pair placed
+    :param messages:
+    :param rotor: the message's rotor at the end of its search range
+    :param message: index of the message in messages
+    :param ends:
+    :return: the child's initial rotor and search range ends
+    """
+    plaintext, cryptext = messages[message]
+    end = ends[message]
+    for cipher_position, plain_position in find_open_positions(rotor):
+        new_rotor = RotorState(rotor.text_index, rotor.cipher_rotor.copy(), rotor.cipher_set | {cryptext[end]},
+                               rotor.plain_rotor.copy(), rotor.plain_set | {plaintext[end]})
+        new_rotor.cipher_rotor[cipher_position], new_rotor.plain_rotor[plain_position] = cryptext[end], plaintext[end]
+        traverse_to(plaintext, 0, new_rotor)
+        yield new_rotor, list(ends)
+
+
+def settle_messages(messages: List[Tuple[str, str]], initial_rotor: RotorState, ends: List[int]) -> \
+        Optional[Tuple[RotorState, List[RotorState], List[int]]]:
+    """
+    Runs fill_in on every message in turn, starting each from the shared initial rotor moved to the end of its search
+    range, and carries whatever it fills in back to the initial rotor. Repeats until a whole round fills in nothing.
+    :param messages:
+    :param initial_rotor:
+    :param ends: updated in place
+    :return: the updated initial rotor, every message's rotor at the end of its search range and ends, or None if a
+    message contradicts the guesses
+    """
+    while True:
+        rotors = list()
+        for message, (plaintext, cryptext) in enumerate(messages):
+            rotor = RotorState(0, initial_rotor.cipher_rotor.copy(), initial_rotor.cipher_set.copy(),
+                               initial_rotor.plain_rotor.copy(), initial_rotor.plain_set.copy())
+            traverse_to(plaintext, ends[message], rotor)
+            search_range = SearchRange(0, ends[message])
+            known = len(rotor.plain_set) + len(rotor.cipher_set)
+            if fill_forced(plaintext, cryptext, rotor, search_range) is None:
+                return None
+            ends[message] = search_range.end
+            if len(rotor.plain_set) + len(rotor.cipher_set) != known:
+                initial_rotor = RotorState(rotor.text_index, rotor.cipher_rotor.copy(), rotor.cipher_set,
+                                           rotor.plain_rotor.copy(), rotor.plain_set)
+                traverse_to(plaintext, 0, initial_rotor)
+                break
+            rotors.append(rotor)
+        else:
+            return initial_rotor, rotors, ends
 
 
 def decide_direction(plaintext: str, cryptext: str, rotor: RotorState, search_range: SearchRange) -> int:
     """
-    A crude heuristic to decide the direction to generate a new permutation in the depth first search based on how close
-    an available pair is in the plaintext, a mediocre proxy for information density. Could be further optimized.
+    A heuristic to decide the direction to generate a new permutation in the depth first search, as a proxy for
+    information density. The guess goes to the side whose nearest pinned pair (counting the pair being guessed, see
+    OccurrenceIndex) is closest, since that is where a wrong guess is refuted soonest.
     :param plaintext:
     :param cryptext:
     :param rotor:
     :param search_range:
     :return:
     """
-    forward = 1
-    backwards = -1
     if search_range.start == 0:
         return search_range.end
     if search_range.end == len(plaintext):
         return search_range.start
-    while (plaintext[search_range.end + forward] not in rotor.plain_set or cryptext[search_range.end + forward] not in \
-           rotor.cipher_rotor) and forward + search_range.end < len(plaintext):
-        forward += 1
-        if forward + search_range.end < len(plaintext):
-            return search_range.start
-    while (plaintext[search_range.start + backwards] not in rotor.plain_set or cryptext[
-        search_range.start + backwards] not in rotor.cipher_rotor) and search_range.start + backwards > 0:
-        backwards -= 1
-        if search_range.start + backwards > 0:
-            return search_range.end
-    return search_range.end if forward <= abs(backwards) else search_range.start
+    if rotor.occurrences is None:
+        rotor.occurrences = OccurrenceIndex(plaintext, cryptext)
+    occurrences = rotor.occurrences
+    end, before = search_range.end, search_range.start - 1
+    forward = occurrences.pinned_distance(end + 1, True, occurrences.membership(rotor.plain_set, plaintext[end]),
+                                          occurrences.membership(rotor.cipher_set, cryptext[end]))
+    backwards = occurrences.pinned_distance(before - 1, False,
+                                            occurrences.membership(rotor.plain_set, plaintext[before]),
+                                            occurrences.membership(rotor.cipher_set, cryptext[before]))
+    return search_range.end if forward <= backwards else search_range.start
+
+
+def is_complete(rotor: RotorState) -> bool:
+    """
+    Whether every slot of both rotors has been filled in
+    :param rotor:
+    :return:
+    """
+    return len(rotor.plain_set) == len(rotor.plain_rotor) and len(rotor.cipher_set) == len(rotor.cipher_rotor)
 
 
 def find_open_positions(rotor: RotorState, backwards: bool = False) -> List[Tuple[int, int]]:
@@ -253,8 +1186,8 @@ def find_open_positions(rotor: RotorState, backwards: bool = False) -> List[Tupl
     :return:
     """
     rotation_offset = -1 if backwards else 0
-    return [(i, i + rotation_offset) for i in range(26) if
-            rotor.plain_rotor[i + rotation_offset] == "#" and rotor.cipher_rotor[i] == "#"]
+    return [(i, i + rotation_offset) for i in range(len(rotor.cipher_rotor)) if
+            rotor.plain_rotor[i + rotation_offset] == PLACEHOLDER and rotor.cipher_rotor[i] == PLACEHOLDER]
 
 
 def check_function(plaintext: str, cryptext: str, rotor_state: RotorState, search_range: SearchRange) -> bool:
@@ -283,7 +1216,7 @@ def check_function(plaintext: str, cryptext: str, rotor_state: RotorState, searc
 
 def valid_mutation(rotor_deque: Deque, rotor_set: Set, fill_char: str, modify_type: str, direction: str) -> bool:
     fill_position = -1 if modify_type == "plain" and direction == "forward" else 0
-    return (rotor_deque[fill_position] in ("#", fill_char)) and (
+    return (rotor_deque[fill_position] in (PLACEHOLDER, fill_char)) and (
                 rotor_deque[fill_position] == fill_char or fill_char not in rotor_set)
 
 
@@ -295,6 +1228,8 @@ def fill_character(plaintext: str, cryptext: str, rotor_state: RotorState, searc
     modify_rotor = rotor_state.plain_rotor if modify_type == "plain" else rotor_state.cipher_rotor
     modify_text = plaintext if modify_type == "plain" else cryptext
     modify_set = rotor_state.plain_set if modify_type == "plain" else rotor_state.cipher_set
+    if rotor_state.stats is not None:
+        rotor_state.stats.forced_fills += 1
     modify_rotor[fill_position] = modify_text[search_index + index_mod]
     modify_set.add(modify_text[search_index + index_mod])
     if direction == "forward":
@@ -321,10 +1256,9 @@ def try_direction(plaintext: str, cryptext: str, rotor_state: RotorState, search
     to_fill_text = plaintext if mut_rotor == "plain" else cryptext
     filled_position = search_range.end if mut_dir == "forward" else search_range.start - 1
     traverse_position = search_range.end + 1 if mut_dir == "forward" else search_range.start - 1
-    filled_char = filled_text[search_range.end] if mut_dir == "forward" else filled_text[search_range.start - 1]
     boundary_condition = search_range.end != len(plaintext) if mut_dir == "forward" else search_range.start != 0
 
-    if boundary_condition and filled_char in filled_set:
+    if boundary_condition and filled_text[filled_position] in filled_set:
         traverse_to(filled_text, traverse_position, rotor_state, mut_rotor != "cipher")
         if not valid_mutation(to_fill_rotor, to_fill_set, to_fill_text[filled_position], mut_rotor, mut_dir):
             return None
@@ -333,42 +1267,171 @@ def try_direction(plaintext: str, cryptext: str, rotor_state: RotorState, search
     return True
 
 
-def find_starting_position(plaintext: str, cryptext: str, window_size: int):
+class WindowCounter:
+    def __init__(self, window_size: int):
+        """
+        Symbol counts for a window of fixed size sliding over a plaintext and its cryptext, so that its score (the
+        number of distinct plaintext plus distinct cryptext characters) is kept up to date in O(1) per step. Symbols
+        that leave the window keep a zero count rather than being deleted.
+        :param window_size:
+        """
+        if window_size < 1:
+            raise ValueError("window sizes must be at least 1")
+        self.window_size = window_size
+        self.plain_counts = dict()
+        self.cipher_counts = dict()
+        self.score = 0
+
+    def add(self, plain_char: str, crypt_char: str) -> None:
+        plain_count = self.plain_counts.get(plain_char, 0)
+        self.plain_counts[plain_char] = plain_count + 1
+        cipher_count = self.cipher_counts.get(crypt_char, 0)
+        self.cipher_counts[crypt_char] = cipher_count + 1
+        self.score += (not plain_count) + (not cipher_count)
+
+    def remove(self, plain_char: str, crypt_char: str) -> None:
+        plain_count = self.plain_counts[plain_char] - 1
+        self.plain_counts[plain_char] = plain_count
+        cipher_count = self.cipher_counts[crypt_char] - 1
+        self.cipher_counts[crypt_char] = cipher_count
+        self.score -= (not plain_count) + (not cipher_count)
+
+
+def scan_windows(plaintext: Iterable[str], cryptext: Iterable[str], window_sizes: Sequence[int]) -> \
+Iterator[Tuple[int, int, int]]:
+    """
+    Scores the windows of every given size in a single pass over the texts, which may be any iterables of characters
+    (a stream that does not fit in memory included); only the widest window is held. Like find_starting_position
+    always has, the last window of each size is not scored: the window starting at i is scored when character
+    i + window_size arrives.
+    :param plaintext:
+    :param cryptext:
+    :param window_sizes:
+    :return: (window size, window start, score) for every window, in the order they are scored
+    """
+    counters = [WindowCounter(window_size) for window_size in window_sizes]
+    history: Deque[Tuple[str, str]] = deque(maxlen=max(window_sizes))
+    for text_index, pair in enumerate(zip(plaintext, cryptext)):
+        for counter in counters:
+            if text_index >= counter.window_size:
+                yield counter.window_size, text_index - counter.window_size, counter.score
+                counter.remove(*history[-counter.window_size])
+            counter.add(*pair)
+        history.append(pair)
+
+
+def find_starting_position(plaintext: Iterable[str], cryptext: Iterable[str], window_size: int):
     best_start_index = 0
     best_start_set_size = 52
-    plaintext_list = [character for character in plaintext]
-    cryptext_list = [character for character in cryptext]
-    for i in range(len(plaintext) - window_size):
-        plaintext_set = set(plaintext_list[i:i + window_size])
-        cryptext_set = set(cryptext_list[i:i + window_size])
-        new_set_size = len(plaintext_set) + len(cryptext_set)
+    for _, i, new_set_size in scan_windows(plaintext, cryptext, [window_size]):
         if new_set_size < best_start_set_size:
             best_start_index = i + window_size // 2
             best_start_set_size = new_set_size
     return best_start_index
 
 
-def crack_rotor(plaintext: str, cryptext: str, initialize_str_size = 6):
+def sweep_starting_positions(plaintext: Iterable[str], cryptext: Iterable[str], window_sizes: Sequence[int],
+                             count: int) -> Dict[int, List[int]]:
+    """
+    rank_starting_positions for several window sizes at once, from a single pass over the texts (see scan_windows).
+    Window starts are bucketed by score, which is at most twice the window size, so ranking needs no sort.
+    :param plaintext:
+    :param cryptext:
+    :param window_sizes:
+    :param count:
+    :return: the ranked starting positions for each window size
+    """
+    buckets: Dict[int, Dict[int, array]] = {window_size: dict() for window_size in window_sizes}
+    for window_size, i, score in scan_windows(plaintext, cryptext, window_sizes):
+        size_buckets = buckets[window_size]
+        if score not in size_buckets:
+            size_buckets[score] = array("q")
+        size_buckets[score].append(i)
+    ranked = dict()
+    for window_size, size_buckets in buckets.items():
+        chosen: List[int] = list()
+        chosen_sorted: List[int] = list()
+        for score in sorted(size_buckets):
+            for i in size_buckets[score]:
+                if len(chosen) == count:
+                    break
+                nearest = bisect_left(chosen_sorted, i)
+                if (nearest == len(chosen_sorted) or chosen_sorted[nearest] - i >= window_size) and \
+                        (nearest == 0 or i - chosen_sorted[nearest - 1] >= window_size):
+                    chosen.append(i)
+                    chosen_sorted.insert(nearest, i)
+        ranked[window_size] = [i + window_size // 2 for i in chosen]
+    return ranked
+
+
+def rank_starting_positions(plaintext: Iterable[str], cryptext: Iterable[str], window_size: int, count: int) -> \
+List[int]:
+    """
+    The count best starting positions by the same measure as find_starting_position, best first, with windows that do
+    not overlap each other. Used to launch several searches at once.
+    :param plaintext:
+    :param cryptext:
+    :param window_size:
+    :param count:
+    :return:
+    """
+    return sweep_starting_positions(plaintext, cryptext, [window_size], count)[window_size]
+
+
+def crack_rotor(plaintext: str, cryptext: str, initialize_str_size = 6, checkpoint_interval: Optional[int] = None,
+                stats: Optional[SearchStats] = None, size: int = ROTOR_SIZE):
     """
     For a plaintext and a cryptext, returns the initial rotor state and the final rotor state
     :param plaintext:
     :param cryptext:
     :param initialize_str_size:
-    :return:
+    :param checkpoint_interval: see crack
+    :param stats: see crack; also times the choice of starting position
+    :param size: see crack
+    :return: both rotors, or None for both if the search found nothing or was aborted
     """
-    initial_rotor = crack(plaintext, cryptext, find_starting_position(plaintext,cryptext, initialize_str_size))
+    phase_start = time.perf_counter()
+    start_index = find_starting_position(plaintext, cryptext, initialize_str_size)
+    if stats is not None:
+        stats.phase_times["start_position"] += time.perf_counter() - phase_start
+    initial_rotor = crack(plaintext, cryptext, start_index, checkpoint_interval, stats=stats, size=size)
+    if initial_rotor is None:
+        return None, None
     final_rotor = deepcopy(initial_rotor)
     decode_string(cryptext[:initial_rotor.text_index], initial_rotor)
     return initial_rotor, final_rotor
 
 
+def verify_rotor(plaintext: str, cryptext: str, initial_rotor: RotorState) -> bool:
+    """
+    Checks that an initial rotor (text index 0) really encodes the plaintext to the cryptext. The rotor is not modified.
+    :param plaintext:
+    :param cryptext:
+    :param initial_rotor:
+    :return:
+    """
+    rotor = RotorState(initial_rotor.text_index, initial_rotor.cipher_rotor.copy(), None, initial_rotor.plain_rotor.copy(),
+                       None)
+    try:
+        return encode_string(plaintext, rotor) == cryptext
+    except ValueError:
+        return False
+
+
+# Byrne's Exhibits 1 and 2, the known plaintext and ciphertext pairs used as reference cases
+EXHIBIT_1_PLAINTEXT = 'ALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYW'
+EXHIBIT_1_CRYPTEXT = "CLYTZPNZKLDDQGFBOOTYSNEPUAGKIUNKNCRINRCVKJNHTOAFQPDPNCVLTVFICOTSSLWYYIHBICFUTHXNUVKGIMVEZYWSTHEPIEWXNNGFTOGHSRTBZXTMVGLTJXCSQXLNJTENCSVLCWRTBENZLSUVYIDAXLAFATQSRNZOPHKYGQJTOGYSDBNVDJOWHKECRMLYWIQIFIKSCYJGCVXNSKYHRYVYEDSZRIFFZAQNHSOMJPORWTJOIJIPKVHZGPWQKRXDMAUEFFXIACFLCZMAFZSJEOZIFKJCFMETESYYHZUVLFFURRHRIIFFDZMTTOVKLZOVLPVPPGVGEWWEFRFYHKXOPKXRQSZKLCZKHZWXRJXLMVFGGFGYIFDAEINIWPOMOUVRFBUZLAGDBCUAMFQLACRWWTUGSMPPZBRFASROYIRCAGVEYNSRTOQTDLFJRUTKFKASGVLVYYFVRAIYNIVJKIUWPFZBVRUEOTEJGLCGYSSNHHQTIQWUKQASXKGSPWHRYMTQSOQBAMAPFQRLIIUGTIVBEBYXFBIUSEYHMLKGOECSWUHTBIZZHLBNDIWTQAMAZBMYMBEKCYKCABLYQYMELPJOWNRVFZVKREBVUJEQIAEMOHTGFHFFIDIQQJUAWDHLUYREUGSKTIMDWRRNONJKDPTCJDCJNBVEOUTWXOFGRXNDKITNLOXSLZWQRDERERHLXWAMYLRVPRJFHRASDJWWOIWEVAVMRRNLRJMIFDHHADDQCBZWYKDVPAYNPIAXBYUKIJGVUCACJHFXRALOVRLZUVANABNZDZTPFQRIYCLLZYILTWJBPAFLPOIOZTBPIUSRXCDCITEEKMJBHPPYONYEGSZWGURIFIPWUMTLJYVYNEACGJXJAGCXQPDLABSYMUDOKYDWRXCJUFPXCPBWYQPHMTAXNROBASQRZYVJXOHUXFPBIHGGPKRFDMWTOTMKBOLBRRNOCHWLQDVNEEVXBNEGHJQQCVIEFYMEQRXSYEWVJZTQXDEWKWSWIEEHDSNRHRCVDUYOGNGVDPRHUTYKPRAOIVCUJDYVLOWBMGSTFTXUVOXGZZUIIRYXSAVEPRWPKQJMSVGYBNECJOKCNMFPGPHLKQQMBSLPMACOZCNBRYAUOHNHBESMIZTCEOBFKWXCEIOXZXEEIVJHGLQPQHMNFHXETYYPEAQBUDWKNDXDZBSLXXXCTLHCIWBIQHXHNYYFNHNHYXARKZMCRNZTONKZKOSGNWFKJXRPQZIBRCPXCWFCCIMEKLBABSHYAEYGFQDVTSDRQBSVRFKQGUQVTKCBEROIETFATNGHQOAHBAMSXAKVKBSYLROROIXQEZAPHAFCFFQWOZJULUZBEQAGYIPZPHABQQRIXLHRMSLJTSDHHCVAHUPWSFMHVHJTRHAFDJFWCLEWEKUMFJINAYGKRSLHNJFXYTHFPUPHULQIZGLQIMGWBEAVTJAAPUMPYEMGDMUAGMAMZOTIRTTOWFVNKCYAQGZRFGXMBAVIXJCWNLIEPENPVKIMNSSQTWPRUMWEGGJUNRQXTATEBLDIUEZTEXHZYVWGXSOJGQHZVPPAWLFSHDUSONOQORTCMRNCESRVXQQWLJVISRPSBHJDVYSROSREHBDDEBAWPDOGJMXAVJKETMAPTTKRHQZANXNGLMQWJDTCQCYOUEYYCDNCPSHDRPGVNEALLJJMGHGAOQGRRHNCARAIQUKXSIFUTUTEQMBJAYYPXCUTTNGFPXNWFOZYSETAZWVZZLWPNLMCQNPPQCELZMUELJYAJCPMLNTGDWELPNEQXSVMXUAMSJIMTJIBYNXTEFYBNOESLMNVFYNPQHMNMIDEIHISTYQQVDRNZIBXAIKSXOKESPNXIMTEKILQXOPONSNZPWQZEPOYCYCXJFACZAEBXXGMPQDHNQTPPWXKIMASNMOLVCVTOPYVMSESPCSSLSGPPQZWPBIJOCZIPAFAPFPGSMOGUFPMEBYEALEIOEHVKJVYSYSOCEAGXASVYZEDCJRJTIYBDINAOMYBGLPBRXZANBCHFDZTNJIGPFCUUTKMGSURULBJCMNIQKCXBJIXOIZHTACVDKITWPHXZCPMUBDBITSTCKVCPUFYHIOWBSBKFZGRBEYVGSQYCNVTORGVOFRYFJJEHTBWYAKIMMZQRLQYMRQOSGKCVVELTCYSVLLYHSHMAZCXCQNKKTCBHZNOMMPTKKWQYSFMOIQKKELZNCXVBRZGGOKSCGPBPLARQLRTVYOXMZCWEYBIHOZMSWXCIBOUSEYCYDPVGBPCUGDVEVCGKCAUPYZITDITNZXVKPYJROJIDQHINBWCVVFDEVGHWYWXLIKKFIHIIZAXOPIDHUWQXNWLMYVDDHGOIAZSCCQFZULJAOOLCMADUWYTLYVTQWQTGHENGOORMJWZOEWTQLJCFBUGAIEUMRTDKALNVVOONASBINQWRPBFCGWZKNVXGQTXJBIQZYOXCFKUSOTXNNYRNVYOHDQAXDDACDLRCVKOMSXIHQITUNOMAXDMISISFSMBYTLSAEEIPGCNHFMLFEAEXFAUPOKMSBMNZYUHEMZLBQMROIUHKECCEIXDARVFAEVWDHPSGYTTAZRNTOWRSTDYOKCWNQUISWEFIFLFFZQBSDCSCBNRQSZLXBBRICQCLSCBINRYORGNZEGCYAWPMCQLCGBMXBBUBONQOZZOFNQRYMZWACDMGXNAIRAABKCIOWTGTCTOOKMFRPGXADLNAAJSUBMTIQVHOUZTBCZALEOPOYVEWOUSDUNTZTJTYXUIGOZQFSVDDSRJWUFHFGIZSORJTBIVSKBBHMPQNXMWKAGSNTKJWOXHALOVWEXTSVKIYFADOMONPZCZFZROCBIRWPUNTAXWXSERPGPPURINGDCGFDGZALDTNXPUQEPQSUZVKDOTXTBNMUQASZKIGHWQRQIDWXAITYXBQQCJWFYGNZEFMABHSBFPXRCYGTEQOTROFXXHXEJYDQLKILKRNXCHWYWLEYFHBTUZXZJKVSCVOYKJNRCLOOZARVLBSZGTYHGUJZHZVWTWCPCJURABTHXCNSUHCGQYEALLUPICHXEUSTQXXVTPBNSSGFHXJKGAMXEZPQSVYNZQFVEMKKQUEMQJAZQVSTGBCZNVIMZKOTWVYAMIBJATZCJWMDTMZJFMZZNCCDOVLZFALKUVABWMMQXEGFUCTNGCFZKUBACBIURQBZJUYYTJGBIJLFUFIPPIUWJMSYKWUPMYDBJOPRCGAUOWGLUBCHIKDMTWKWBSIAVNKOQGSPYVNYUZYRBPHGZXIRAGIGFNXGZFMWOCGLXMGDKRNQQBXTVGNLEOWTSQJXCOXMKBBQXBCHLWRIBDKLZCXZBEMNYUJBAJLPBSGQDSSAZBDBXTSWDJBSRBUJBZXBPCACTVNTWIOPFZDQCYCHMMFKHUSRNTKWCOTOXGXTBUKDRBCZYZNCYXLCAKQMIMNPNJHOPAJNVBWWFSZKXDRGSNRXNIEKGFHYJLIORGOFSPJHBHWDMIOCWOHZCDLYSSPXUZTKSMMCGEAUMTMQRVYWLJFBVVJFNLIKIBUSXXTHOKZOUSRWRUHUEVJKTUZUVJKJMZJYUHLWJAVTYTHRCXTIZHDCMKTWFTJISPRCBNFTOXOFKQCRUBNGLZGXRPMTPEDGQDKKHQAYWRKAQQXRSVEFEOAXQULXYUBZOPBKMKQLMMZABCTHZKRJAZJWDLNAAPMJHGWMXBMUPULDBRDJQFFZYWKCENNEQZQLKEAKLAJMPTIBWGBUATXCYUTKBNPWTOQRIGBNFTZFTIGSVWHEQGDECFGVHOFMAIIRPNXQREFBYCBEDDZMRVSIEDYYDIBVGRPSBTFFWLVGXGUZMKYSYVLLODQPSTZRNJTINYWRAWANCJQSBLXNEMEHFBCIWHCODUJFLXHLYKASTOVPPEVUGBMCUVYXXHNBMZMEYNELCINYVBVVBVCMAJDIIJMZDWOUYLGFOVTXXGCDYCGTQFTFKXSPICISAGWAJBKANRVKHGLMKJFDPEBJLGSIIYAHGPRACYCGTMQXEHVUFDJGYHPZDRQNJOCOEBJIFECAEUDCPAIDUKNBGTUOJGJVLQFSVUTZASCQDQBGDJBNZOATITQEJVXXNBEICFPEWJCYIRFYHAUDTSCDBCYCLYMRDQMFYTGVOJEAYVDYXLBBTWROYWYVPCZSYTTMQYGPGJZJXTQZAPNPHRAQXIORJHZAZACYQDQFKEHGUTNFVTEUOQKIIHFAFUAFWHOFSHJBJNHFRBFXAZMICUKWEGFQRTFNKYQLJYESIAAFRRKCQNLFERDFKDKSMQUONOYXGHPITVGMOQDEGYGKUBXWNTTKNBFBPWQDIMTIVZWWMOIOJZQMOWLHYHDWQJADWCJCZZTTYAUWUJRFKSLLXMVEUVHTWIUPXVRHKPCHSMWLPLOTBJONYVETMMFPGHVEJEPIFSTYNCLUYIVOYCSYDUOQXHYDGSYMBXGWBGNWDFYTLEEKDJUUJXZRTCSZEJRFXLNQQYLPNNWARUCLRHSBOMOEOAIQLIXYNSAVDACEIBKUDKADMYPRMYTQAWHAVTXOOPBFYSZDYKBGSJDFCNLQNWAOGNTOIVJZRVSIACOOKEYINOZBNPKEGHFJFASYSDIFBNXNXFJPSAMRVBQGXNIZBMVGVUVNFMUFJXELBZLTPIFIWBLBXPBQDXAWFRHBFQPDCMOXOSUMMERKQNMYFYKDOCBOXIYSPLGVPBLNGNKTAKYNGBXMIPOMRIDCLTCIBZHFLDVRXBKFLRKMUCQHEYRAAVHXAYDHNNNUNJCINARAEXPUAQRPRUDMOOHOOMEMGUPIEEIXAQTLUPETXIBQEPNIWBREBNSEQRDUGGTGWURQRJRLXGRDPMJPDXTSDBGYYQDRDQYSZGLXDRIDLYXFIVSQWZVQGQRXLNLBLGTEGHVNZXRFNHFQOWXIXBEULILOMRXQOGJXRCJOUZHOTJAKDMFERTTWFOXVGVEUIBDGWUGTFHBNXMEZNHBCOGDEBBOPZZWMTRYRSDXCUTFLPHZYVHTOTIJOPJPQTPMUZJYLUFPULWLWQOIAMJRSRAWNQTHMOWLHUGSXSNKFLAUOTUMXYTOFRYZIRIDTESKKMOGJHLBBDODRLSWZRRGVAVOGENKOOZXMGWQSTUGJSWSOEUCIOYTIZYSEWUWWLPXMFBRRRPVPHVACKESYKWKPJIFOJEQLZZOKRMBSGLQYMRGAPCTZJGHGGRCLYXPHXYLBIKHNSOZOMTAOEYJCBYIXDVZVFENUDIUTJGGPTEREYHKQLDCRUMBKNRSXQTCVXTBWQXZKQOSIMELPDROVWTRPITOONSRUFPGQVSYBQDKOLCBVNXBUCGZMMWIKOWWZEOZFDWSLYUTGXPLMDUFESIHPKUCXMMFQQMQIOPALOFBFPWSDPSMDZLZOWOBIVZFKNEUBSAAIZYXOKGPVQCHEQUHGVOFZZJDNSTPVWSYQSSYNTHGBTWZBKGLIDSAFARCJBWJDOQGGOQODVRHKOBYTIKGNSS"
+EXHIBIT_2_PLAINTEXT = "GALLIAESTOMNISDIVISAINPARTESTRESWWWHORUMOMNIUMFORTISSIMISUNTBELGAEYPROPTEREAQUODACULTUATQUEHUMANITATEPROVINCIAELONGISSIMEABSUNTYMINIMEQUEADEOSMERCATORESSAEPECOMMEANTATQUEEAQUAEADEFFEMINANDOSANIMOSPERTINENTIMPORTANTYPROXIMIQUESUNTGERMANISYQUITRANSRHENUMINCOLUNTYQUIBUSCUMCONTINENTERBELLUMGERUNTWQUADECAUSAHELVETIIQUOQUERELIQUOSGALLOSVIRTUTEPRAECEDUNTYQUODFERECOTIDIANISPROELIISCUMGERMANISCONTENDUNTYCUMAUTSUISFINIBUSEOSPROHIBENTYAUTIPSIINEORUMFINIBUSBELLUMGERUNTWWWHISREBUSFIEBATUTETMINUSLATEVAGAREENTURETMINUSFACILEFINITIMISBELLUMINFERREPOSSENTYQUAEXPARTEHOMINESBELLANDICUPIDIMAGNODOLOREADFICIEBANTURWPROMULTITUDINEAUTEMHOMINUMETPROGLORIABELLIATQUEFORTITUDINISANGUSTOSSEFINESHABEREARBITRABANTURYQUIINLONGITUDINEMMILIAPASSUUMCCXLYINLATITUDINEMCLXXXPATEBANTWWWADEASRESCONFICIENDASBIENNIUMSIBISATISESSEDUXERUNTYINTERTIUMANNUMPROFECTIONEMLEGECONFIRMANTWADEASRESCONFICIENDASORGETORIXDELIGITURWISSIBILEGATIONEMADCIVITATESSUSCEPITWINEOITINEREPERSUADETCASTICOYCATAMANTALOEDISFILIOYSEQUANOYCUJUSPATERREGNUMINSEQUANISMULTOSANNOSOBTINUERATETASENATUPOPULIROMANIAMICUSAPPELATUSERATYUTREGNUMINCIVITATESUAOCCUPARETYQUODPATERANTEHABUERATWWWHACORATIONEADDUCTIINTERSEFIDEMETJUSJURANDUMDANTYETREGNOOCCUPATOPERTRESPOTENTISSIMOSACFIRMISSIMOSPOPULOSTOTIUSGALLIAESESEPOTIRIPOSSESPERANTW"
+EXHIBIT_2_CRYPTEXT = "TLXWFWYHBICOJSPURTJMFDKTJBFAEFGBRJOSISVKRGRPKOKXZQBXHSYNZRXDYXZDXBDAGALVCYGCMXEQISZITMNICJQHQXJJUMSAGESXWFJUAKJWUREKMUIXYMFAJCVURVAECLAKDWJBHBSJDWRQOPHUHPFGDONUPWDIYVDRSESXPNRNSZMCXIYSOXBZPDSKBFSQXSYPDEGSJUSNXBJMVVWAVDPZILECGXBKKNFKVOXVKTBEQSCNKHDYQRYNNHNHQPJWXVUGWDGUWNDOIIUHKWWJMXXEGXITIKKTAXWLZRBFQFVEIVWMRXOBIFNPQDMPYUARZELHDKDSCEKACMDZZBGSUFMZRCLQUSICSRVSFHHKHHPVIBCCNZJHCRTOZUOCCLWDWIEWBGFYJPQNNHTNNIBTLYWZAQSDHBORBHKBHFBBZHZHQXUBURTIEYELGDOFLBSVOEMGBFUCDLJDDRGGIOJVGJTZXSRQDGIKWIDKZPXFDCZWODHBWMRCVKJQRZFRJGFCTCLYXTIMNIXCKOKWXKDRQMHLQWUACSYWXEVFSUGXNBCUZJVKLSDLUPYVVIVHDZSYAXDAXLTPRPTCWQDXECKJOQAEKSKWNATLVZUWZUDQAHZCROYYMCENWQMYMJDHKAORTNPOAWNASLVHGOUSWHLRFROBQISVRMTDOQPGBLITUPZXBVPDWVXUOBREDOLFACGKRKKGMBYHDGODKQRAZHNULWBEJQKFSPXJSXJQBOHYSRJXNCNIASEXDXUJYHJHLUPIQTVPCWWJIJQPPEKKTGCPVUALISGUHVUMXXDIVXMMYHQWZWYQUMHUAQSMNDBKJGNRJYSGCUVRSPNSYEGDSMIWKPREQKSJYBKNPCSWGBFXGMLWPSYWYRDKYSWMQETOPMQBGYLHOQRZCGMIBFHSAMQIWDIPAXWDUWSUNARTTJIPAHILZSSQFVQNIYCZKTJIVUVQALFOETXFHLLUQBQKSDDJORHFFBMELCNZDABWWNFSPOKCSCAQGWZTXJTTQWKTOFBWDSHOWGXFIQHUJOQIGLLNLJOJHKESRNHPROEUFLKFJXWEKUDHRKUHYPWRRHXWBQDGNTUJIUELDMIEHALHGWFNXGUGGLTMTJSMAHNJNTNTYHNVZJTOINEVBQNCVSOAXUOZRVHDHZJNHLVOFURIYJPKMIBWOVGCJKKJLQTYZJQVPOWRRNGLFSFJLTBCSCSUOZJZNWTQSBECOEVXFIJWEQSXSFYNSQRFJPINAPKGFNOJCRK"
+
+
 def main():
     pass
 
    # # Exhibit 1
-    plain = 'ALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYWALLGOODQQUICKBROWNFOXESJUMPOVERLAZYDOGTOSAVETHEIRPARTYW'
+    plain = EXHIBIT_1_PLAINTEXT
     plain = plain.lower()
-    cipher = "CLYTZPNZKLDDQGFBOOTYSNEPUAGKIUNKNCRINRCVKJNHTOAFQPDPNCVLTVFICOTSSLWYYIHBICFUTHXNUVKGIMVEZYWSTHEPIEWXNNGFTOGHSRTBZXTMVGLTJXCSQXLNJTENCSVLCWRTBENZLSUVYIDAXLAFATQSRNZOPHKYGQJTOGYSDBNVDJOWHKECRMLYWIQIFIKSCYJGCVXNSKYHRYVYEDSZRIFFZAQNHSOMJPORWTJOIJIPKVHZGPWQKRXDMAUEFFXIACFLCZMAFZSJEOZIFKJCFMETESYYHZUVLFFURRHRIIFFDZMTTOVKLZOVLPVPPGVGEWWEFRFYHKXOPKXRQSZKLCZKHZWXRJXLMVFGGFGYIFDAEINIWPOMOUVRFBUZLAGDBCUAMFQLACRWWTUGSMPPZBRFASROYIRCAGVEYNSRTOQTDLFJRUTKFKASGVLVYYFVRAIYNIVJKIUWPFZBVRUEOTEJGLCGYSSNHHQTIQWUKQASXKGSPWHRYMTQSOQBAMAPFQRLIIUGTIVBEBYXFBIUSEYHMLKGOECSWUHTBIZZHLBNDIWTQAMAZBMYMBEKCYKCABLYQYMELPJOWNRVFZVKREBVUJEQIAEMOHTGFHFFIDIQQJUAWDHLUYREUGSKTIMDWRRNONJKDPTCJDCJNBVEOUTWXOFGRXNDKITNLOXSLZWQRDERERHLXWAMYLRVPRJFHRASDJWWOIWEVAVMRRNLRJMIFDHHADDQCBZWYKDVPAYNPIAXBYUKIJGVUCACJHFXRALOVRLZUVANABNZDZTPFQRIYCLLZYILTWJBPAFLPOIOZTBPIUSRXCDCITEEKMJBHPPYONYEGSZWGURIFIPWUMTLJYVYNEACGJXJAGCXQPDLABSYMUDOKYDWRXCJUFPXCPBWYQPHMTAXNROBASQRZYVJXOHUXFPBIHGGPKRFDMWTOTMKBOLBRRNOCHWLQDVNEEVXBNEGHJQQCVIEFYMEQRXSYEWVJZTQXDEWKWSWIEEHDSNRHRCVDUYOGNGVDPRHUTYKPRAOIVCUJDYVLOWBMGSTFTXUVOXGZZUIIRYXSAVEPRWPKQJMSVGYBNECJOKCNMFPGPHLKQQMBSLPMACOZCNBRYAUOHNHBESMIZTCEOBFKWXCEIOXZXEEIVJHGLQPQHMNFHXETYYPEAQBUDWKNDXDZBSLXXXCTLHCIWBIQHXHNYYFNHNHYXARKZMCRNZTONKZKOSGNWFKJXRPQZIBRCPXCWFCCIMEKLBABSHYAEYGFQDVTSDRQBSVRFKQGUQVTKCBEROIETFATNGHQOAHBAMSXAKVKBSYLROROIXQEZAPHAFCFFQWOZJULUZBEQAGYIPZPHABQQRIXLHRMSLJTSDHHCVAHUPWSFMHVHJTRHAFDJFWCLEWEKUMFJINAYGKRSLHNJFXYTHFPUPHULQIZGLQIMGWBEAVTJAAPUMPYEMGDMUAGMAMZOTIRTTOWFVNKCYAQGZRFGXMBAVIXJCWNLIEPENPVKIMNSSQTWPRUMWEGGJUNRQXTATEBLDIUEZTEXHZYVWGXSOJGQHZVPPAWLFSHDUSONOQORTCMRNCESRVXQQWLJVISRPSBHJDVYSROSREHBDDEBAWPDOGJMXAVJKETMAPTTKRHQZANXNGLMQWJDTCQCYOUEYYCDNCPSHDRPGVNEALLJJMGHGAOQGRRHNCARAIQUKXSIFUTUTEQMBJAYYPXCUTTNGFPXNWFOZYSETAZWVZZLWPNLMCQNPPQCELZMUELJYAJCPMLNTGDWELPNEQXSVMXUAMSJIMTJIBYNXTEFYBNOESLMNVFYNPQHMNMIDEIHISTYQQVDRNZIBXAIKSXOKESPNXIMTEKILQXOPONSNZPWQZEPOYCYCXJFACZAEBXXGMPQDHNQTPPWXKIMASNMOLVCVTOPYVMSESPCSSLSGPPQZWPBIJOCZIPAFAPFPGSMOGUFPMEBYEALEIOEHVKJVYSYSOCEAGXASVYZEDCJRJTIYBDINAOMYBGLPBRXZANBCHFDZTNJIGPFCUUTKMGSURULBJCMNIQKCXBJIXOIZHTACVDKITWPHXZCPMUBDBITSTCKVCPUFYHIOWBSBKFZGRBEYVGSQYCNVTORGVOFRYFJJEHTBWYAKIMMZQRLQYMRQOSGKCVVELTCYSVLLYHSHMAZCXCQNKKTCBHZNOMMPTKKWQYSFMOIQKKELZNCXVBRZGGOKSCGPBPLARQLRTVYOXMZCWEYBIHOZMSWXCIBOUSEYCYDPVGBPCUGDVEVCGKCAUPYZITDITNZXVKPYJROJIDQHINBWCVVFDEVGHWYWXLIKKFIHIIZAXOPIDHUWQXNWLMYVDDHGOIAZSCCQFZULJAOOLCMADUWYTLYVTQWQTGHENGOORMJWZOEWTQLJCFBUGAIEUMRTDKALNVVOONASBINQWRPBFCGWZKNVXGQTXJBIQZYOXCFKUSOTXNNYRNVYOHDQAXDDACDLRCVKOMSXIHQITUNOMAXDMISISFSMBYTLSAEEIPGCNHFMLFEAEXFAUPOKMSBMNZYUHEMZLBQMROIUHKECCEIXDARVFAEVWDHPSGYTTAZRNTOWRSTDYOKCWNQUISWEFIFLFFZQBSDCSCBNRQSZLXBBRICQCLSCBINRYORGNZEGCYAWPMCQLCGBMXBBUBONQOZZOFNQRYMZWACDMGXNAIRAABKCIOWTGTCTOOKMFRPGXADLNAAJSUBMTIQVHOUZTBCZALEOPOYVEWOUSDUNTZTJTYXUIGOZQFSVDDSRJWUFHFGIZSORJTBIVSKBBHMPQNXMWKAGSNTKJWOXHALOVWEXTSVKIYFADOMONPZCZFZROCBIRWPUNTAXWXSERPGPPURINGDCGFDGZALDTNXPUQEPQSUZVKDOTXTBNMUQASZKIGHWQRQIDWXAITYXBQQCJWFYGNZEFMABHSBFPXRCYGTEQOTROFXXHXEJYDQLKILKRNXCHWYWLEYFHBTUZXZJKVSCVOYKJNRCLOOZARVLBSZGTYHGUJZHZVWTWCPCJURABTHXCNSUHCGQYEALLUPICHXEUSTQXXVTPBNSSGFHXJKGAMXEZPQSVYNZQFVEMKKQUEMQJAZQVSTGBCZNVIMZKOTWVYAMIBJATZCJWMDTMZJFMZZNCCDOVLZFALKUVABWMMQXEGFUCTNGCFZKUBACBIURQBZJUYYTJGBIJLFUFIPPIUWJMSYKWUPMYDBJOPRCGAUOWGLUBCHIKDMTWKWBSIAVNKOQGSPYVNYUZYRBPHGZXIRAGIGFNXGZFMWOCGLXMGDKRNQQBXTVGNLEOWTSQJXCOXMKBBQXBCHLWRIBDKLZCXZBEMNYUJBAJLPBSGQDSSAZBDBXTSWDJBSRBUJBZXBPCACTVNTWIOPFZDQCYCHMMFKHUSRNTKWCOTOXGXTBUKDRBCZYZNCYXLCAKQMIMNPNJHOPAJNVBWWFSZKXDRGSNRXNIEKGFHYJLIORGOFSPJHBHWDMIOCWOHZCDLYSSPXUZTKSMMCGEAUMTMQRVYWLJFBVVJFNLIKIBUSXXTHOKZOUSRWRUHUEVJKTUZUVJKJMZJYUHLWJAVTYTHRCXTIZHDCMKTWFTJISPRCBNFTOXOFKQCRUBNGLZGXRPMTPEDGQDKKHQAYWRKAQQXRSVEFEOAXQULXYUBZOPBKMKQLMMZABCTHZKRJAZJWDLNAAPMJHGWMXBMUPULDBRDJQFFZYWKCENNEQZQLKEAKLAJMPTIBWGBUATXCYUTKBNPWTOQRIGBNFTZFTIGSVWHEQGDECFGVHOFMAIIRPNXQREFBYCBEDDZMRVSIEDYYDIBVGRPSBTFFWLVGXGUZMKYSYVLLODQPSTZRNJTINYWRAWANCJQSBLXNEMEHFBCIWHCODUJFLXHLYKASTOVPPEVUGBMCUVYXXHNBMZMEYNELCINYVBVVBVCMAJDIIJMZDWOUYLGFOVTXXGCDYCGTQFTFKXSPICISAGWAJBKANRVKHGLMKJFDPEBJLGSIIYAHGPRACYCGTMQXEHVUFDJGYHPZDRQNJOCOEBJIFECAEUDCPAIDUKNBGTUOJGJVLQFSVUTZASCQDQBGDJBNZOATITQEJVXXNBEICFPEWJCYIRFYHAUDTSCDBCYCLYMRDQMFYTGVOJEAYVDYXLBBTWROYWYVPCZSYTTMQYGPGJZJXTQZAPNPHRAQXIORJHZAZACYQDQFKEHGUTNFVTEUOQKIIHFAFUAFWHOFSHJBJNHFRBFXAZMICUKWEGFQRTFNKYQLJYESIAAFRRKCQNLFERDFKDKSMQUONOYXGHPITVGMOQDEGYGKUBXWNTTKNBFBPWQDIMTIVZWWMOIOJZQMOWLHYHDWQJADWCJCZZTTYAUWUJRFKSLLXMVEUVHTWIUPXVRHKPCHSMWLPLOTBJONYVETMMFPGHVEJEPIFSTYNCLUYIVOYCSYDUOQXHYDGSYMBXGWBGNWDFYTLEEKDJUUJXZRTCSZEJRFXLNQQYLPNNWARUCLRHSBOMOEOAIQLIXYNSAVDACEIBKUDKADMYPRMYTQAWHAVTXOOPBFYSZDYKBGSJDFCNLQNWAOGNTOIVJZRVSIACOOKEYINOZBNPKEGHFJFASYSDIFBNXNXFJPSAMRVBQGXNIZBMVGVUVNFMUFJXELBZLTPIFIWBLBXPBQDXAWFRHBFQPDCMOXOSUMMERKQNMYFYKDOCBOXIYSPLGVPBLNGNKTAKYNGBXMIPOMRIDCLTCIBZHFLDVRXBKFLRKMUCQHEYRAAVHXAYDHNNNUNJCINARAEXPUAQRPRUDMOOHOOMEMGUPIEEIXAQTLUPETXIBQEPNIWBREBNSEQRDUGGTGWURQRJRLXGRDPMJPDXTSDBGYYQDRDQYSZGLXDRIDLYXFIVSQWZVQGQRXLNLBLGTEGHVNZXRFNHFQOWXIXBEULILOMRXQOGJXRCJOUZHOTJAKDMFERTTWFOXVGVEUIBDGWUGTFHBNXMEZNHBCOGDEBBOPZZWMTRYRSDXCUTFLPHZYVHTOTIJOPJPQTPMUZJYLUFPULWLWQOIAMJRSRAWNQTHMOWLHUGSXSNKFLAUOTUMXYTOFRYZIRIDTESKKMOGJHLBBDODRLSWZRRGVAVOGENKOOZXMGWQSTUGJSWSOEUCIOYTIZYSEWUWWLPXMFBRRRPVPHVACKESYKWKPJIFOJEQLZZOKRMBSGLQYMRGAPCTZJGHGGRCLYXPHXYLBIKHNSOZOMTAOEYJCBYIXDVZVFENUDIUTJGGPTEREYHKQLDCRUMBKNRSXQTCVXTBWQXZKQOSIMELPDROVWTRPITOONSRUFPGQVSYBQDKOLCBVNXBUCGZMMWIKOWWZEOZFDWSLYUTGXPLMDUFESIHPKUCXMMFQQMQIOPALOFBFPWSDPSMDZLZOWOBIVZFKNEUBSAAIZYXOKGPVQCHEQUHGVOFZZJDNSTPVWSYQSSYNTHGBTWZBKGLIDSAFARCJBWJDOQGGOQODVRHKOBYTIKGNSS"
+    cipher = EXHIBIT_1_CRYPTEXT
     cipher = cipher.lower()
 
     # plain_edit = []
@@ -389,9 +1452,9 @@ def main():
 
     # Exhibit 2
 
-    # plain_2 = "GALLIAESTOMNISDIVISAINPARTESTRESWWWHORUMOMNIUMFORTISSIMISUNTBELGAEYPROPTEREAQUODACULTUATQUEHUMANITATEPROVINCIAELONGISSIMEABSUNTYMINIMEQUEADEOSMERCATORESSAEPECOMMEANTATQUEEAQUAEADEFFEMINANDOSANIMOSPERTINENTIMPORTANTYPROXIMIQUESUNTGERMANISYQUITRANSRHENUMINCOLUNTYQUIBUSCUMCONTINENTERBELLUMGERUNTWQUADECAUSAHELVETIIQUOQUERELIQUOSGALLOSVIRTUTEPRAECEDUNTYQUODFERECOTIDIANISPROELIISCUMGERMANISCONTENDUNTYCUMAUTSUISFINIBUSEOSPROHIBENTYAUTIPSIINEORUMFINIBUSBELLUMGERUNTWWWHISREBUSFIEBATUTETMINUSLATEVAGAREENTURETMINUSFACILEFINITIMISBELLUMINFERREPOSSENTYQUAEXPARTEHOMINESBELLANDICUPIDIMAGNODOLOREADFICIEBANTURWPROMULTITUDINEAUTEMHOMINUMETPROGLORIABELLIATQUEFORTITUDINISANGUSTOSSEFINESHABEREARBITRABANTURYQUIINLONGITUDINEMMILIAPASSUUMCCXLYINLATITUDINEMCLXXXPATEBANTWWWADEASRESCONFICIENDASBIENNIUMSIBISATISESSEDUXERUNTYINTERTIUMANNUMPROFECTIONEMLEGECONFIRMANTWADEASRESCONFICIENDASORGETORIXDELIGITURWISSIBILEGATIONEMADCIVITATESSUSCEPITWINEOITINEREPERSUADETCASTICOYCATAMANTALOEDISFILIOYSEQUANOYCUJUSPATERREGNUMINSEQUANISMULTOSANNOSOBTINUERATETASENATUPOPULIROMANIAMICUSAPPELATUSERATYUTREGNUMINCIVITATESUAOCCUPARETYQUODPATERANTEHABUERATWWWHACORATIONEADDUCTIINTERSEFIDEMETJUSJURANDUMDANTYETREGNOOCCUPATOPERTRESPOTENTISSIMOSACFIRMISSIMOSPOPULOSTOTIUSGALLIAESESEPOTIRIPOSSESPERANTW"
+    # plain_2 = EXHIBIT_2_PLAINTEXT
     # plain_2 = plain_2.lower()
-    # cipher_2 = "TLXWFWYHBICOJSPURTJMFDKTJBFAEFGBRJOSISVKRGRPKOKXZQBXHSYNZRXDYXZDXBDAGALVCYGCMXEQISZITMNICJQHQXJJUMSAGESXWFJUAKJWUREKMUIXYMFAJCVURVAECLAKDWJBHBSJDWRQOPHUHPFGDONUPWDIYVDRSESXPNRNSZMCXIYSOXBZPDSKBFSQXSYPDEGSJUSNXBJMVVWAVDPZILECGXBKKNFKVOXVKTBEQSCNKHDYQRYNNHNHQPJWXVUGWDGUWNDOIIUHKWWJMXXEGXITIKKTAXWLZRBFQFVEIVWMRXOBIFNPQDMPYUARZELHDKDSCEKACMDZZBGSUFMZRCLQUSICSRVSFHHKHHPVIBCCNZJHCRTOZUOCCLWDWIEWBGFYJPQNNHTNNIBTLYWZAQSDHBORBHKBHFBBZHZHQXUBURTIEYELGDOFLBSVOEMGBFUCDLJDDRGGIOJVGJTZXSRQDGIKWIDKZPXFDCZWODHBWMRCVKJQRZFRJGFCTCLYXTIMNIXCKOKWXKDRQMHLQWUACSYWXEVFSUGXNBCUZJVKLSDLUPYVVIVHDZSYAXDAXLTPRPTCWQDXECKJOQAEKSKWNATLVZUWZUDQAHZCROYYMCENWQMYMJDHKAORTNPOAWNASLVHGOUSWHLRFROBQISVRMTDOQPGBLITUPZXBVPDWVXUOBREDOLFACGKRKKGMBYHDGODKQRAZHNULWBEJQKFSPXJSXJQBOHYSRJXNCNIASEXDXUJYHJHLUPIQTVPCWWJIJQPPEKKTGCPVUALISGUHVUMXXDIVXMMYHQWZWYQUMHUAQSMNDBKJGNRJYSGCUVRSPNSYEGDSMIWKPREQKSJYBKNPCSWGBFXGMLWPSYWYRDKYSWMQETOPMQBGYLHOQRZCGMIBFHSAMQIWDIPAXWDUWSUNARTTJIPAHILZSSQFVQNIYCZKTJIVUVQALFOETXFHLLUQBQKSDDJORHFFBMELCNZDABWWNFSPOKCSCAQGWZTXJTTQWKTOFBWDSHOWGXFIQHUJOQIGLLNLJOJHKESRNHPROEUFLKFJXWEKUDHRKUHYPWRRHXWBQDGNTUJIUELDMIEHALHGWFNXGUGGLTMTJSMAHNJNTNTYHNVZJTOINEVBQNCVSOAXUOZRVHDHZJNHLVOFURIYJPKMIBWOVGCJKKJLQTYZJQVPOWRRNGLFSFJLTBCSCSUOZJZNWTQSBECOEVXFIJWEQSXSFYNSQRFJPINAPKGFNOJCRK"
+    # cipher_2 = EXHIBIT_2_CRYPTEXT
     # cipher_2 = cipher_2.lower()
     # test_2 = crack(plain_2[:52], cipher_2[:52], find_starting_position(plain_2[:52], cipher_2[:52], 6))
     # print(test_2.plain_rotor)
@@ -0,0 +1,186 @@
+from typing import Iterator, List, Optional, Tuple
+import multiprocessing
+import os
+
+from Chaocipher.chaocipher import ROTOR_SIZE, RotorState, SearchStats, crack, find_starting_position, \
+    permutation_tables, traverse_to
+
+# Nodes the full search may expand at each surviving offset
+CRIB_NODE_BUDGET = 2000
+
+
+class CribMatch:
+    def __init__(self, offset: int, coverage: float, repeats: int, rotor: Optional[RotorState] = None,
+                 aborted: Optional[str] = None):
+        """
+        An offset where a crib could not be ruled out
+        :param offset: index in the ciphertext of the first crib character
+        :param coverage: largest fraction of the crib any rotor was found consistent with; 1.0 when a rotor fits all of
+        it, which is the only case where rotor is set
+        :param repeats: number of repeated symbols in the crib and its ciphertext window, each of which is a check the
+        rotor had to pass (see window_repeats)
+        :param rotor: a partially filled rotor that encodes the crib into the window, at text index 0 of the crib
+        :param aborted: why the search stopped early, if it did
+        """
+        self.offset = offset
+        self.coverage = coverage
+        self.repeats = repeats
+        self.rotor = rotor
+        self.aborted = aborted
+
+    @property
+    def consistent(self) -> bool:
+        return self.rotor is not None
+
+    def __repr__(self):
+        return f"CribMatch(offset={self.offset}, coverage={self.coverage:.2f}, repeats={self.repeats})"
+
+
+def repeat_horizon(size: int = ROTOR_SIZE) -> int:
+    """
+    The smallest distance at which a plaintext symbol can be encrypted to the same ciphertext symbol again. After a
+    step the pair just used sits at the zenith of the cipher rotor and the end of the plain rotor, and it can only be
+    used again once both are back at the same slot. This follows every slot the two can reach, over all ring indexes,
+    until they meet; the result does not depend on the key. For 26 slots it is 7.
+    :param size: number of slots on each rotor
+    :return:
+    """
+    if size in _repeat_horizon_cache:
+        return _repeat_horizon_cache[size]
+    encode_cipher, encode_plain, _, _ = permutation_tables(size)
+    # new_slot[r][s] is where the symbol in slot s ends up after a step with ring index r
+    new_cipher_slot, new_plain_slot = [[0] * size for _ in range(size)], [[0] * size for _ in range(size)]
+    for ring_index in range(size):
+        for slot in range(size):
+            new_cipher_slot[ring_index][encode_cipher[ring_index][slot]] = slot
+            new_plain_slot[ring_index][encode_plain[ring_index][slot]] = slot
+    frontier = {(0, size - 1)}
+    seen = set(frontier)
+    distance = 1
+    while not any(cipher_slot == plain_slot for cipher_slot, plain_slot in frontier):
+        next_frontier = set()
+        for cipher_slot, plain_slot in frontier:
+            for ring_index in range(size):
+                slots = (new_cipher_slot[ring_index][cipher_slot], new_plain_slot[ring_index][plain_slot])
+                if slots not in seen:
+                    seen.add(slots)
+                    next_frontier.add(slots)
+        frontier = next_frontier
+        distance += 1
+    _repeat_horizon_cache[size] = distance
+    return distance
+
+
+_repeat_horizon_cache = dict()
+
+
+def repeat_pairs(crib: str, horizon: int) -> List[Tuple[int, int]]:
+    """
+    The pairs of crib positions closer than horizon that hold the same symbol. Their ciphertext symbols must differ.
+    :param crib:
+    :param horizon: see repeat_horizon
+    :return:
+    """
+    return [(i, j) for i in range(len(crib)) for j in range(i + 1, min(len(crib), i + horizon)) if crib[i] == crib[j]]
+
+
+def window_repeats(crib: str, window: str) -> int:
+    return 2 * len(crib) - len(set(crib)) - len(set(window))
+
+
+def candidate_offsets(crib: str, cryptext: str, size: int = ROTOR_SIZE) -> Iterator[int]:
+    """
+    The offsets that pass the repeat rule (see repeat_horizon), a check of a few character comparisons
+    :param crib:
+    :param cryptext:
+    :param size:
+    :return:
+    """
+    pairs = repeat_pairs(crib, repeat_horizon(size))
+    for offset in range(len(cryptext) - len(crib) + 1):
+        if all(cryptext[offset + i] != cryptext[offset + j] for i, j in pairs):
+            yield offset
+
+
+def examine_offset(crib: str, cryptext: str, offset: int, window_size: int = 6,
+                   node_budget: Optional[int] = CRIB_NODE_BUDGET, time_limit: Optional[float] = None,
+                   size: int = ROTOR_SIZE) -> Optional[CribMatch]:
+    """
+    Tests the crib at one offset with a crack of the crib against its ciphertext window, limited by node_budget and
+    time_limit
+    :param crib:
+    :param cryptext:
+    :param offset:
+    :param window_size: see find_starting_position
+    :param node_budget:
+    :param time_limit: seconds
+    :param size: number of slots on each rotor
+    :return: None if the offset was ruled out
+    """
+    window = cryptext[offset:offset + len(crib)]
+    start_index = find_starting_position(crib, window, max(1, min(window_size, len(crib) - 1)))
+    stats = SearchStats(node_budget=node_budget, time_limit=time_limit)
+    completed = crack(crib, window, start_index, stats=stats, size=size)
+    if completed is None and stats.aborted is None:
+        return None
+    if completed is not None:
+        traverse_to(crib, 0, completed)
+        return CribMatch(offset, 1.0, window_repeats(crib, window), completed)
+    return CribMatch(offset, stats.max_coverage, window_repeats(crib, window), aborted=stats.aborted)
+
+
+def init_worker(crib: str, cryptext: str, options: dict) -> None:
+    global worker_task
+    worker_task = (crib, cryptext, options)
+
+
+def offset_worker(offset: int) -> Optional[CribMatch]:
+    crib, cryptext, options = worker_task
+    return examine_offset(crib, cryptext, offset, **options)
+
+
+worker_task: Optional[Tuple[str, str, dict]] = None
+
+
+def drag_crib(crib: str, cryptext: str, workers: Optional[int] = None, window_size: int = 6,
+              node_budget: Optional[int] = CRIB_NODE_BUDGET, time_limit: Optional[float] = None,
+              size: int = ROTOR_SIZE) -> Iterator[CribMatch]:
+    """
+    Slides a known plaintext fragment along the ciphertext and yields every offset where it could not be ruled out, as
+    soon as it is known. Offsets are ruled out in two stages, cheapest first: the repeat rule in this process, then a
+    limited crack of the crib in a pool of worker processes.
+
+    A crib pins few rotor slots, so the crack rules out far fewer offsets than the repeat rule does, and a long crib
+    rarely completes within the node budget even at its true offset. Nothing a match records tells the true offset
+    apart: wrong offsets find a consistent rotor as often, in as few nodes, and their searches get as far.
+    :param crib:
+    :param cryptext:
+    :param workers: number of worker processes, defaults to the number of cpus
+    :param window_size: see find_starting_position
+    :param node_budget: nodes per offset for the full search, None for no limit
+    :param time_limit: seconds per offset for the full search, None for no limit
+    :param size: number of slots on each rotor
+    :return:
+    """
+    if not crib or len(crib) > len(cryptext):
+        raise ValueError("the crib must be non-empty and no longer than the ciphertext")
+    workers = workers if workers else os.cpu_count()
+    offsets = list(candidate_offsets(crib, cryptext, size))
+    options = {"window_size": window_size, "node_budget": node_budget, "time_limit": time_limit, "size": size}
+    chunk_size = max(1, min(64, len(offsets) // (4 * workers)))
+    with multiprocessing.Pool(workers, init_worker, (crib, cryptext, options)) as pool:
+        for match in pool.imap_unordered(offset_worker, offsets, chunk_size):
+            if match is not None:
+                yield match
+
+
+def crib_drag(crib: str, cryptext: str, workers: Optional[int] = None, **options) -> List[CribMatch]:
+    """
+    drag_crib, collected in offset order
+    :param crib:
+    :param cryptext:
+    :param workers:
+    :param options: see drag_crib
+    :return:
+    """
+    return sorted(drag_crib(crib, cryptext, workers, **options), key=lambda match: match.offset)
@@ -0,0 +1,304 @@
+from typing import Dict, Iterable, Iterator, Optional, Sequence, Set, TextIO, Tuple
+from multiprocessing.connection import Connection, wait
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from Chaocipher.chaocipher import ROTOR_SIZE, RotorState, SearchStats, crack_rotor, permutation_tables, verify_rotor
+from Chaocipher.parallel_chao import POLL_INTERVAL
+
+# How long a job may overrun its timeout before its worker is killed. Within the search the timeout is enforced by
+# SearchStats, which stops cleanly and still reports the node count; the kill covers the rest of the job.
+KILL_GRACE = 1.0
+# Failure reasons that depend on the run rather than on the job (limits, crashes), so a job that failed with one of
+# them is tried again on a restart, where the limits may be different
+RETRY_REASONS = ("timeout", "memory limit", "worker exited", "node budget", "time limit")
+# Job options and their defaults; the command line overrides the defaults and each job can override the command line
+JOB_DEFAULTS = {"window_size": 6, "size": ROTOR_SIZE, "checkpoint_interval": None, "node_budget": None,
+                "timeout": None}
+# The options that can be null to mean no limit or no checkpoints
+NULLABLE_OPTIONS = ("checkpoint_interval", "node_budget", "timeout")
+# Largest rotor a CheckpointIndex can hold
+MAX_CHECKPOINT_SIZE = 128
+
+
+def read_jobs(lines: Iterable[str]) -> Iterator[dict]:
+    """
+    Parses a JSONL job stream lazily. Each job needs "plaintext" and "ciphertext" and may set "id" and any of the
+    JOB_DEFAULTS options. Jobs without an id are numbered by their line, so a restart has to read the same input.
+    Blank lines are skipped; a line that is not a JSON object becomes a job that fails with the parse error.
+    :param lines:
+    :return:
+    """
+    for line_number, line in enumerate(lines):
+        if not line.strip():
+            continue
+        try:
+            job = json.loads(line)
+        except ValueError as error:
+            job = {"error": f"invalid JSON: {error}"}
+        if not isinstance(job, dict):
+            job = {"error": "a job must be a JSON object"}
+        job.setdefault("id", line_number)
+        yield job
+
+
+def is_final(result: dict) -> bool:
+    """
+    Whether running the job again would give the same result: it was solved, or it failed for a reason that lies in
+    the job itself (bad input, no rotor fits) rather than in a limit or crash of the run, see RETRY_REASONS
+    :param result:
+    :return:
+    """
+    return bool(result.get("solved")) or not str(result.get("reason", "")).startswith(RETRY_REASONS)
+
+
+def completed_ids(path: str) -> Set[str]:
+    """
+    The ids of the jobs in a results file that need not run again, see is_final. A last line cut short by a crash is
+    ignored, so that job runs again.
+    :param path:
+    :return:
+    """
+    ids = set()
+    if not os.path.exists(path):
+        return ids
+    with open(path) as results_file:
+        for line in results_file:
+            try:
+                result = json.loads(line)
+                if is_final(result):
+                    ids.add(str(result["id"]))
+            except (ValueError, KeyError, TypeError, AttributeError):
+                continue
+    return ids
+
+
+def job_problem(job: dict, defaults: dict = JOB_DEFAULTS) -> Optional[str]:
+    """
+    Why a job cannot be run, or None if it can. Everything the worker would only find out by failing is checked here,
+    with the job's options filled in from defaults.
+    :param job:
+    :param defaults: see run_jobs
+    :return:
+    """
+    if "error" in job:
+        return job["error"]
+    if not isinstance(job.get("plaintext"), str) or not isinstance(job.get("ciphertext"), str):
+        return "a job needs plaintext and ciphertext strings"
+    if len(job["plaintext"]) != len(job["ciphertext"]):
+        return "plaintext and ciphertext have different lengths"
+    if not job["plaintext"]:
+        return "the texts are empty"
+    unknown = set(job) - set(JOB_DEFAULTS) - {"id", "plaintext", "ciphertext"}
+    if unknown:
+        return f"unknown job options {sorted(unknown)}"
+    problem = option_problem(job)
+    if problem is not None:
+        return problem
+    options = {name: job.get(name, value) for name, value in defaults.items()}
+    try:
+        permutation_tables(options["size"])
+    except ValueError as error:
+        return str(error)
+    if options["checkpoint_interval"] is not None and options["size"] > MAX_CHECKPOINT_SIZE:
+        return f"checkpoints need rotors of at most {MAX_CHECKPOINT_SIZE} slots"
+    for name, text in (("plaintext", job["plaintext"]), ("ciphertext", job["ciphertext"])):
+        if len(set(text)) > options["size"]:
+            return f"the {name} has more distinct symbols than the {options['size']} rotor slots"
+    if options["window_size"] > len(job["plaintext"]):
+        return f"window_size {options['window_size']} is longer than the texts"
+    return None
+
+
+def option_problem(options: dict) -> Optional[str]:
+    """
+    Why some job options are not usable, or None if they are. The job's own options are checked before its worker
+    starts, so a bad value fails that job instead of the run.
+    :param options: any of the JOB_DEFAULTS options
+    :return:
+    """
+    for name in ("window_size", "size", "checkpoint_interval", "node_budget"):
+        value = options.get(name)
+        if value is None and name in NULLABLE_OPTIONS:
+            continue
+        if name in options and (not isinstance(value, int) or isinstance(value, bool) or value < 1):
+            return f"{name} must be a positive integer{' or null' if name in NULLABLE_OPTIONS else ''}"
+    timeout = options.get("timeout")
+    if timeout is not None and (not isinstance(timeout, (int, float)) or isinstance(timeout, bool) or
+                                not 0 < timeout < float("inf")):
+        return "timeout must be a positive number of seconds or null"
+    return None
+
+
+def rotor_record(rotor: RotorState) -> dict:
+    return {"cipher_rotor": list(rotor.cipher_rotor), "plain_rotor": list(rotor.plain_rotor),
+            "text_index": rotor.text_index}
+
+
+def crack_job(job: dict, options: dict, memory_limit: Optional[int], sender: Connection) -> None:
+    """
+    Runs crack_rotor on one job in a worker process and sends its result record back through its own pipe
+    :param job:
+    :param options: the job's options, defaults filled in
+    :param memory_limit: address space limit for the worker in bytes, None for no limit
+    :param sender:
+    :return:
+    """
+    if memory_limit is not None and resource is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+    plaintext, cryptext = job["plaintext"], job["ciphertext"]
+    stats = SearchStats(node_budget=options["node_budget"], time_limit=options["timeout"])
+    result = {"id": job["id"], "solved": False}
+    start = time.perf_counter()
+    try:
+        initial_rotor, final_rotor = crack_rotor(plaintext, cryptext, options["window_size"],
+                                                 options["checkpoint_interval"], stats, options["size"])
+        if initial_rotor is None:
+            result["reason"] = stats.aborted if stats.aborted else "no rotor fits the texts"
+        elif not verify_rotor(plaintext, cryptext, initial_rotor):
+            result["reason"] = "the rotor found does not reproduce the ciphertext"
+        else:
+            result.update(solved=True, initial_rotor=rotor_record(initial_rotor),
+                          final_rotor=rotor_record(final_rotor))
+    except MemoryError:
+        result["reason"] = "memory limit"
+    except Exception as error:
+        result["reason"] = f"{type(error).__name__}: {error}"
+    result.update(seconds=time.perf_counter() - start, nodes=stats.nodes, stats=stats.as_dict())
+    sender.send(result)
+    sender.close()
+
+
+def run_jobs(jobs: Iterable[dict], output: TextIO, workers: Optional[int] = None, defaults: Optional[dict] = None,
+             memory_limit: Optional[int] = None, skip: Set[str] = frozenset()) -> Dict[str, int]:
+    """
+    Cracks a stream of jobs, each in its own worker process, at most workers at a time, writing one result line per
+    job to output as soon as it is known (in order of completion, flushed after every line). Jobs are read from the
+    stream only as workers free up, so the input can be of any length. A worker that overruns its job's timeout is
+    killed and the next job takes its place, so no single job can hold up the rest.
+    :param jobs: see read_jobs
+    :param output:
+    :param workers: number of worker processes, defaults to the number of cpus
+    :param defaults: options for jobs that do not set them, see JOB_DEFAULTS; ValueError if they are not usable
+    :param memory_limit: address space limit for each worker in bytes (where the platform supports it)
+    :param skip: ids (as strings) of jobs to leave out, see completed_ids
+    :return: counts of solved, failed and skipped jobs
+    """
+    workers = workers if workers else os.cpu_count()
+    defaults = dict(JOB_DEFAULTS, **(defaults or dict()))
+    problem = option_problem(defaults)
+    if problem is not None:
+        raise ValueError(problem)
+    counts = {"solved": 0, "failed": 0, "skipped": 0}
+    running: Dict[Connection, Tuple[multiprocessing.Process, dict, float, float]] = dict()
+
+    def write(result: dict) -> None:
+        counts["solved" if result["solved"] else "failed"] += 1
+        output.write(json.dumps(result) + "\n")
+        output.flush()
+
+    job_iterator = iter(jobs)
+    exhausted = False
+    try:
+        while not exhausted or running:
+            while not exhausted and len(running) < workers:
+                job = next(job_iterator, None)
+                if job is None:
+                    exhausted = True
+                    break
+                if str(job["id"]) in skip:
+                    counts["skipped"] += 1
+                    continue
+                problem = job_problem(job, defaults)
+                if problem is not None:
+                    write({"id": job["id"], "solved": False, "reason": problem})
+                    continue
+                options = {name: job.get(name, value) for name, value in defaults.items()}
+                receiver, sender = multiprocessing.Pipe(duplex=False)
+                process = multiprocessing.Process(target=crack_job, daemon=True,
+                                                  args=(job, options, memory_limit, sender))
+                start = time.monotonic()
+                process.start()
+                sender.close()
+                deadline = start + options["timeout"] + KILL_GRACE if options["timeout"] is not None else float("inf")
+                running[receiver] = (process, job, start, deadline)
+            for receiver in wait(list(running), timeout=POLL_INTERVAL):
+                process, job, start, _ = running.pop(receiver)
+                try:
+                    result = receiver.recv()
+                except EOFError:
+                    result = None
+                receiver.close()
+                process.join()
+                if result is None:
+                    result = {"id": job["id"], "solved": False,
+                              "reason": f"worker exited with code {process.exitcode}",
+                              "seconds": time.monotonic() - start}
+                write(result)
+            now = time.monotonic()
+            for receiver, (process, job, start, deadline) in list(running.items()):
+                if now > deadline:
+                    process.terminate()
+                    process.join()
+                    receiver.close()
+                    del running[receiver]
+                    write({"id": job["id"], "solved": False, "reason": "timeout", "seconds": now - start})
+        return counts
+    finally:
+        for receiver, (process, _, _, _) in running.items():
+            process.terminate()
+            process.join()
+            receiver.close()
+
+
+def main(arguments: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Recover Chaocipher rotors for a file of known plaintext and "
+                                                 "ciphertext pairs")
+    parser.add_argument("input", nargs="?", default="-", help="JSONL job file, - for stdin")
+    parser.add_argument("--output", required=True,
+                        help="JSONL results file; jobs already in it are skipped unless they failed on a limit "
+                             "or crash, new results are appended")
+    parser.add_argument("--workers", type=int, help="number of worker processes, defaults to the number of cpus")
+    parser.add_argument("--timeout", type=float, help="seconds allowed per job")
+    parser.add_argument("--memory-limit", type=int, help="megabytes of address space allowed per worker")
+    parser.add_argument("--window-size", type=int, default=JOB_DEFAULTS["window_size"])
+    parser.add_argument("--size", type=int, default=JOB_DEFAULTS["size"], help="number of slots on each rotor")
+    parser.add_argument("--checkpoint-interval", type=int)
+    parser.add_argument("--node-budget", type=int, help="nodes allowed per job")
+    options = parser.parse_args(arguments)
+    defaults = {"window_size": options.window_size, "size": options.size,
+                "checkpoint_interval": options.checkpoint_interval, "node_budget": options.node_budget,
+                "timeout": options.timeout}
+    memory_limit = options.memory_limit * (1 << 20) if options.memory_limit is not None else None
+    skip = completed_ids(options.output)
+    if os.path.exists(options.output) and os.path.getsize(options.output):
+        with open(options.output, "rb") as results_file:
+            results_file.seek(-1, os.SEEK_END)
+            # a crash can leave a partial last line, which must not run into the next result
+            needs_newline = results_file.read(1) != b"\n"
+    else:
+        needs_newline = False
+    job_file = sys.stdin if options.input == "-" else open(options.input)
+    try:
+        with open(options.output, "a") as output:
+            if needs_newline:
+                output.write("\n")
+            counts = run_jobs(read_jobs(job_file), output, options.workers, defaults, memory_limit, skip)
+    finally:
+        if job_file is not sys.stdin:
+            job_file.close()
+    print(f"{counts['solved']} solved, {counts['failed']} failed, {counts['skipped']} already done", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,316 @@
+from typing import Dict, Optional, Tuple
+from collections import deque
+from copy import deepcopy
+from multiprocessing.connection import Connection, wait
+import multiprocessing
+import os
+import queue
+import time
+
+from Chaocipher.chaocipher import ROTOR_SIZE, OccurrenceIndex, RotorState, SearchRange, branches, crack, \
+    decode_string, rank_starting_positions, settle, verify_rotor
+
+# How often the pool wakes up to check for timed out workers when no result arrives, in seconds
+POLL_INTERVAL = 0.05
+
+
+def crack_worker(plaintext: str, cryptext: str, start_index: int, checkpoint_interval: Optional[int], size: int,
+                 sender: Connection) -> None:
+    """
+    Runs crack from one start index in a worker process and sends the result (or None) back through its own pipe, so
+    that terminating one worker can never corrupt another's result
+    """
+    rotor = crack(plaintext, cryptext, start_index, checkpoint_interval, size=size)
+    if rotor is not None:
+        rotor.checkpoints = None
+    sender.send(rotor)
+    sender.close()
+
+
+def crack_parallel(plaintext: str, cryptext: str, candidates: int = 8, workers: Optional[int] = None,
+                   timeout: Optional[float] = None, initialize_str_size: int = 6,
+                   checkpoint_interval: Optional[int] = None, size: int = ROTOR_SIZE) -> \
+        Optional[Tuple[RotorState, RotorState]]:
+    """
+    Parallel version of crack_rotor. The best candidates starting positions (see rank_starting_positions) are each
+    cracked in their own process, at most workers at a time. The first rotor that verifies against the whole text wins
+    and every other worker is terminated; a worker that runs longer than timeout seconds is terminated and the next
+    candidate takes its place.
+    :param plaintext:
+    :param cryptext:
+    :param candidates: number of starting positions to try
+    :param workers: number of worker processes, defaults to the number of cpus
+    :param timeout: per start position time limit in seconds, None for no limit
+    :param initialize_str_size: window size for ranking the starting positions
+    :param checkpoint_interval: see crack
+    :param size: see crack
+    :return: the initial and final rotor states like crack_rotor, or None if no start position produced a rotor
+    """
+    workers = workers if workers else os.cpu_count()
+    pending = deque(rank_starting_positions(plaintext, cryptext, initialize_str_size, candidates))
+    running: Dict[Connection, Tuple[multiprocessing.Process, float]] = dict()
+    try:
+        while pending or running:
+            while pending and len(running) < workers:
+                receiver, sender = multiprocessing.Pipe(duplex=False)
+                process = multiprocessing.Process(target=crack_worker, daemon=True,
+                                                  args=(plaintext, cryptext, pending.popleft(), checkpoint_interval,
+                                                        size, sender))
+                process.start()
+                sender.close()
+                running[receiver] = (process, time.monotonic() + timeout if timeout is not None else float("inf"))
+            for receiver in wait(list(running), timeout=POLL_INTERVAL):
+                process, _ = running.pop(receiver)
+                try:
+                    rotor = receiver.recv()
+                except EOFError:
+                    rotor = None
+                receiver.close()
+                process.join()
+                if rotor is None:
+                    continue
+                final_rotor = deepcopy(rotor)
+                decode_string(cryptext[:rotor.text_index], rotor)
+                if verify_rotor(plaintext, cryptext, rotor):
+                    return rotor, final_rotor
+            now = time.monotonic()
+            for receiver, (process, deadline) in list(running.items()):
+                if now > deadline:
+                    process.terminate()
+                    process.join()
+                    receiver.close()
+                    del running[receiver]
+        return None
+    finally:
+        for receiver, (process, _) in running.items():
+            process.terminate()
+            process.join()
+            receiver.close()
+
+
+# Number of nodes a split search worker expands between checks for idle workers, new bounds and the stop signal
+CHECK_INTERVAL = 64
+
+
+class SplitControl:
+    def __init__(self, size: int = ROTOR_SIZE):
+        """
+        State shared by the main process and the split search workers: a stop signal, how many workers are idle, how
+        many tasks are queued but not yet taken, and in tree order mode the path of the earliest complete rotor so far,
+        beyond which nothing needs to be searched
+        :param size: number of slots on each rotor; every branch fills an empty slot, so no tree path is longer
+        """
+        self.stop = multiprocessing.Event()
+        self.idle = multiprocessing.Value("i", 0)
+        self.queued = multiprocessing.Value("i", 0)
+        self.bound = multiprocessing.Array("i", size + 1)
+
+    def get_bound(self) -> Optional[Tuple[int, ...]]:
+        with self.bound.get_lock():
+            length = self.bound[0]
+            return tuple(self.bound[1:length + 1]) if length else None
+
+    def set_bound(self, path: Tuple[int, ...]) -> None:
+        with self.bound.get_lock():
+            self.bound[0] = len(path)
+            self.bound[1:len(path) + 1] = list(path)
+
+    def wants_work(self) -> bool:
+        return self.idle.value > self.queued.value
+
+
+def search_subtree(plaintext: str, cryptext: str, rotor: RotorState, search_range: SearchRange,
+                   path: Tuple[int, ...], tasks: multiprocessing.Queue, results: multiprocessing.Queue,
+                   control: SplitControl) -> Optional[Tuple[Tuple[int, ...], RotorState]]:
+    """
+    The same search as dfs, run iteratively from one task node. Every node is named by its path from the root (the
+    index of each branch taken), so results from different workers can be put back in tree order. Every
+    CHECK_INTERVAL nodes the worker gives away the shallowest branch it has not started yet if another worker is idle,
+    and stops early if the search is over or everything left is past the tree order bound.
+    :return: the path and rotor of the first complete rotor in this subtree (in dfs order), or None
+    """
+    settled = settle(plaintext, cryptext, rotor, search_range)
+    if settled is None:
+        return None
+    if settled:
+        return path, rotor
+    stack = [(path, enumerate(branches(plaintext, cryptext, rotor, search_range)))]
+    bound = control.get_bound()
+    nodes = 0
+    while stack:
+        node_path, children = stack[-1]
+        child = next(children, None)
+        if child is None:
+            stack.pop()
+            continue
+        child_index, (child_rotor, child_range) = child
+        child_path = node_path + (child_index,)
+        if bound is not None and child_path > bound:
+            stack.pop()
+            continue
+        nodes += 1
+        if nodes % CHECK_INTERVAL == 0:
+            if control.stop.is_set():
+                return None
+            bound = control.get_bound()
+            if control.wants_work():
+                donate_branch(stack, path, tasks, results, control)
+        settled = settle(plaintext, cryptext, child_rotor, child_range)
+        if settled is None:
+            continue
+        if settled:
+            return child_path, child_rotor
+        stack.append((child_path, enumerate(branches(plaintext, cryptext, child_rotor, child_range))))
+    return None
+
+
+def donate_branch(stack: list, task_path: Tuple[int, ...], tasks: multiprocessing.Queue,
+                  results: multiprocessing.Queue, control: SplitControl) -> None:
+    """
+    Moves the shallowest unstarted branch of a running search onto the task queue. The main process is told before the
+    task is queued, so it never believes the search is finished while the branch is still waiting.
+    """
+    for node_path, children in stack:
+        child = next(children, None)
+        if child is None:
+            continue
+        child_index, (child_rotor, child_range) = child
+        child_path = node_path + (child_index,)
+        with control.queued.get_lock():
+            control.queued.value += 1
+        results.put(("donated", task_path, child_path, None))
+        child_rotor.occurrences = None
+        tasks.put((child_path, child_rotor, child_range))
+        return
+
+
+def split_worker(plaintext: str, cryptext: str, tasks: multiprocessing.Queue, results: multiprocessing.Queue,
+                 control: SplitControl) -> None:
+    occurrences = OccurrenceIndex(plaintext, cryptext)
+    while True:
+        with control.idle.get_lock():
+            control.idle.value += 1
+        task = tasks.get()
+        with control.idle.get_lock():
+            control.idle.value -= 1
+        if task is None:
+            return
+        with control.queued.get_lock():
+            control.queued.value -= 1
+        path, rotor, search_range = task
+        rotor.occurrences = occurrences
+        found = None
+        if not control.stop.is_set():
+            found = search_subtree(plaintext, cryptext, rotor, search_range, path, tasks, results, control)
+            if found:
+                found[1].occurrences = None
+        results.put(("done", path) + (found if found else (None, None)))
+
+
+def expand_frontier(plaintext: str, cryptext: str, rotor: RotorState, search_range: SearchRange, depth: int) -> \
+        Tuple[list, list]:
+    """
+    Expands the search tree breadth first to the given depth
+    :return: the open nodes at that depth and the complete rotors found on the way, both as (path, rotor, range) in
+    tree order
+    """
+    complete = list()
+    settled = settle(plaintext, cryptext, rotor, search_range)
+    if settled is None:
+        return [], []
+    if settled:
+        return [], [((), rotor, search_range)]
+    frontier = [((), rotor, search_range)]
+    for _ in range(depth):
+        next_frontier = list()
+        for path, node_rotor, node_range in frontier:
+            for child_index, (child_rotor, child_range) in enumerate(branches(plaintext, cryptext, node_rotor,
+                                                                              node_range)):
+                settled = settle(plaintext, cryptext, child_rotor, child_range)
+                if settled is None:
+                    continue
+                if settled:
+                    complete.append((path + (child_index,), child_rotor, child_range))
+                else:
+                    next_frontier.append((path + (child_index,), child_rotor, child_range))
+        frontier = next_frontier
+    return frontier, complete
+
+
+def crack_split(plaintext: str, cryptext: str, start_index: int, workers: Optional[int] = None,
+                frontier_depth: int = 2, tree_order: bool = False, size: int = ROTOR_SIZE) -> Optional[RotorState]:
+    """
+    Parallel version of crack that splits one search tree across worker processes. The tree is expanded to
+    frontier_depth in this process, and the subtrees are shared out through a task queue; a worker that runs out of
+    work is fed by busy workers giving away branches they have not started. The search stops as soon as a complete
+    rotor is found, or with tree_order, as soon as the rotor dfs would have returned is known: the earliest complete
+    rotor in dfs order, so the result does not depend on timing.
+    :param plaintext:
+    :param cryptext:
+    :param start_index:
+    :param workers: number of worker processes, defaults to the number of cpus
+    :param frontier_depth: depth of the initial breadth first expansion
+    :param tree_order: return the same rotor as crack instead of the first one any worker finds
+    :param size: see crack
+    :return:
+    """
+    workers = workers if workers else os.cpu_count()
+    rotor = RotorState(start_index, size=size)
+    rotor.initialize_for_search(plaintext, cryptext, start_index)
+    rotor.occurrences = OccurrenceIndex(plaintext, cryptext)
+    frontier, complete = expand_frontier(plaintext, cryptext, rotor, SearchRange(start_index, start_index + 1),
+                                         frontier_depth)
+    for _, complete_rotor, _ in complete:
+        complete_rotor.occurrences = None
+    found = [(path, complete_rotor) for path, complete_rotor, _ in complete]
+    if not frontier or (found and not tree_order):
+        return min(found, key=lambda result: result[0])[1] if found else None
+    control = SplitControl(size)
+    tasks, results = multiprocessing.Queue(), multiprocessing.Queue()
+    # Tasks are counted rather than kept in a set: a donated branch can finish before the message announcing it
+    # arrives, since the two come from different processes
+    outstanding: Dict[Tuple[int, ...], int] = dict()
+    best_path = min(path for path, _ in found) if found else None
+    for path, node_rotor, node_range in frontier:
+        if best_path is not None and path > best_path:
+            continue
+        outstanding[path] = 1
+        control.queued.value += 1
+        node_rotor.occurrences = None
+        tasks.put((path, node_rotor, node_range))
+    if best_path is not None:
+        control.set_bound(best_path)
+    processes = [multiprocessing.Process(target=split_worker, args=(plaintext, cryptext, tasks, results, control),
+                                         daemon=True) for _ in range(workers)]
+    for process in processes:
+        process.start()
+    try:
+        while outstanding:
+            try:
+                message, task_path, result_path, result_rotor = results.get(timeout=POLL_INTERVAL)
+            except queue.Empty:
+                if not any(process.is_alive() for process in processes):
+                    raise RuntimeError("split search workers exited before the search was finished")
+                continue
+            count_path, change = (result_path, 1) if message == "donated" else (task_path, -1)
+            outstanding[count_path] = outstanding.get(count_path, 0) + change
+            if outstanding[count_path] == 0:
+                del outstanding[count_path]
+            if result_rotor is None:
+                continue
+            if not tree_order:
+                return result_rotor
+            found.append((result_path, result_rotor))
+            best_path = min(path for path, _ in found)
+            control.set_bound(best_path)
+            if not any(path < best_path for path in outstanding):
+                break
+        return min(found, key=lambda result: result[0])[1] if found else None
+    finally:
+        control.stop.set()
+        for _ in processes:
+            tasks.put(None)
+        for process in processes:
+            process.join(timeout=1)
+            if process.is_alive():
+                process.terminate()
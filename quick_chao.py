@@ -1,7 +1,12 @@
-from collections import deque
+from typing import Optional, Tuple
+from collections import deque, OrderedDict
 from string import ascii_lowercase as alphabet
+import threading
 
-from Chaocipher.chaocipher import RotorState, encode_string
+from Chaocipher.chaocipher import CompactRotor, RotorState, encode_string
+
+# Default number of compiled keys kept by the shared KeyCache
+KEY_CACHE_SIZE = 256
 
 
 def standard_rotor(add_chars=[]):
@@ -10,32 +15,122 @@ def standard_rotor(add_chars=[]):
     return RotorState(0, alphlist.copy(), None, alphlist.copy(), None)
 
 
-def quick_encode(key: str, string: str, add_chars = []):
+class CompiledKey:
+    def __init__(self, key: str, add_chars=[]):
+        """
+        A standard rotor already permuted by key, kept as a CompactRotor. Setting up the key costs as much as encoding
+        the key itself, so a CompiledKey held across many messages pays for it once. Every encode or decode works on
+        its own copy of the keyed rotor, so a CompiledKey can be shared between threads.
+        :param key:
+        :param add_chars: characters added to the standard rotor after the alphabet
+        """
+        self.key = key
+        self.add_chars = tuple(add_chars)
+        rotor = standard_rotor(add_chars)
+        encode_string(key, rotor)
+        rotor.text_index = 0
+        self.compact_rotor = CompactRotor(rotor)
+
+    def rotor(self) -> RotorState:
+        """
+        A new RotorState in the keyed position, ready for encode_string or decode_string
+        :return:
+        """
+        rotor = RotorState(0, deque(), None, deque(), None)
+        self.compact_rotor.store(rotor)
+        return rotor
+
+    def encode(self, string: str) -> str:
+        return "".join(self.compact_rotor.copy().encode(string, len(string)))
+
+    def decode(self, string: str) -> str:
+        return "".join(self.compact_rotor.copy().encode(string, len(string), True))
+
+
+class KeyCache:
+    def __init__(self, max_entries: int = KEY_CACHE_SIZE):
+        """
+        The most recently used CompiledKeys, keyed on (key, add_chars). Least recently used keys are evicted beyond
+        max_entries. Lookups are safe from several threads; two threads missing on the same key at once may both
+        compile it, and the first to finish is kept. Counts hits, misses and evictions.
+        :param max_entries:
+        """
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[Tuple[str, tuple], CompiledKey]" = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str, add_chars=[]) -> CompiledKey:
+        """
+        The CompiledKey for key and add_chars, compiling it on a miss
+        :param key:
+        :param add_chars:
+        :return:
+        """
+        cache_key = (key, tuple(add_chars))
+        with self.lock:
+            compiled_key = self.entries.get(cache_key)
+            if compiled_key is not None:
+                self.entries.move_to_end(cache_key)
+                self.hits += 1
+                return compiled_key
+            self.misses += 1
+        compiled_key = CompiledKey(key, add_chars)
+        with self.lock:
+            compiled_key = self.entries.setdefault(cache_key, compiled_key)
+            self.entries.move_to_end(cache_key)
+            self.evict()
+        return compiled_key
+
+    def resize(self, max_entries: int) -> None:
+        with self.lock:
+            self.max_entries = max_entries
+            self.evict()
+
+    def evict(self) -> None:
+        while len(self.entries) > max(self.max_entries, 0):
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self) -> dict:
+        with self.lock:
+            return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                    "entries": len(self.entries), "max_entries": self.max_entries}
+
+
+key_cache = KeyCache()
+
+
+def quick_encode(key: str, string: str, add_chars = [], cache: Optional[KeyCache] = key_cache):
     """
     Uses a provided key to permute a standard rotor before encoding a string
     :param key:
     :param string:
     :param add_chars:
+    :param cache: where to look up the keyed rotor, or None to set up the key from scratch
     :return:
     """
-    A = standard_rotor(add_chars)
-    encode_string(key, A)
-    A.text_index=0
-    return encode_string(string, A)
+    compiled_key = cache.get(key, add_chars) if cache is not None else CompiledKey(key, add_chars)
+    return compiled_key.encode(string)
 
 
-def quick_decode(key: str, string:str, add_chars = []):
+def quick_decode(key: str, string:str, add_chars = [], cache: Optional[KeyCache] = key_cache):
     """
     Uses a provided key to permute a standard rotor before decoding a string
     :param key:
     :param string:
     :param add_chars:
+    :param cache: where to look up the keyed rotor, or None to set up the key from scratch
     :return:
     """
-    A = standard_rotor(add_chars)
-    encode_string(key, A)
-    A.text_index = 0
-    return encode_string(string, A, True)
+    compiled_key = cache.get(key, add_chars) if cache is not None else CompiledKey(key, add_chars)
+    return compiled_key.decode(string)
 
 
 def main():
@@ -51,4 +146,4 @@ def main():
     print(encoded_str, A.plain_rotor, A.cipher_rotor)
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,413 @@
+from typing import List, Optional, Sequence, Tuple
+from collections import deque
+from string import ascii_lowercase as alphabet
+import multiprocessing
+import os
+import time
+
+import numpy as np
+
+from Chaocipher.chaocipher import CompactRotor, RotorState, permutation_tables, verify_rotor
+
+# Length of the n-grams used for scoring
+NGRAM_LENGTH = 3
+# Count given to n-grams that never occur in the training text, so that one unseen n-gram does not rule a candidate out
+NGRAM_FLOOR = 0.01
+# Candidate rotors decoded and scored together in one batch
+BATCH_SIZE = 1024
+# Batches of random cipher rotors each restart screens, and how many of the best it goes on to climb
+SCREEN_BATCHES = 16
+SCREEN_KEEP = 4
+# Local optima the climb may reach in a row without a new best before it stops, and the random swaps it makes to
+# leave one
+PATIENCE = 20
+KICKS = 5
+
+
+class NgramTable:
+    def __init__(self, log_probs: np.ndarray, symbols: str, n: int):
+        """
+        Log likelihoods of every n-gram over an alphabet, stored flat: the n-gram with symbol codes (a, b, c) is at
+        index a * k^2 + b * k + c for an alphabet of k symbols. Use from_text to build one from a training text.
+        :param log_probs: array of len(symbols) ** n log probabilities
+        :param symbols: the alphabet; the code of a symbol is its index
+        :param n:
+        """
+        if log_probs.shape != (len(symbols) ** n,):
+            raise ValueError(f"an n-gram table of {len(symbols)} symbols and n={n} needs {len(symbols) ** n} entries")
+        self.log_probs = log_probs
+        self.symbols = symbols
+        self.codes = {symbol: code for code, symbol in enumerate(symbols)}
+        self.n = n
+
+    @classmethod
+    def from_text(cls, text: str, symbols: str = alphabet, n: int = NGRAM_LENGTH, floor: float = NGRAM_FLOOR) \
+            -> "NgramTable":
+        """
+        Counts the n-grams of a training text. Characters outside the alphabet are dropped first, so a corpus with
+        spaces and punctuation can be used as it is (after changing its case to match the alphabet).
+        :param text:
+        :param symbols:
+        :param n:
+        :param floor: count given to n-grams that do not occur
+        :return:
+        """
+        codes = {symbol: code for code, symbol in enumerate(symbols)}
+        text_codes = np.array([codes[symbol] for symbol in text if symbol in codes], dtype=np.intp)
+        if len(text_codes) < n:
+            raise ValueError("the training text is shorter than one n-gram")
+        counts = np.bincount(ngram_indexes(text_codes[None, :], len(symbols), n)[0],
+                             minlength=len(symbols) ** n).astype(np.float64)
+        counts += floor
+        return cls(np.log(counts / counts.sum()), symbols, n)
+
+    @classmethod
+    def load(cls, path: str) -> "NgramTable":
+        with np.load(path) as archive:
+            return cls(archive["log_probs"], str(archive["symbols"]), int(archive["n"]))
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as table_file:
+            np.savez(table_file, log_probs=self.log_probs, symbols=self.symbols, n=self.n)
+
+    def threshold(self) -> float:
+        """
+        A score per n-gram that text has to reach to pass for language: a quarter of the way from the average score of
+        text with the statistics of the table towards the average score of uniformly random text. Local optima of a
+        search tend to lie around halfway.
+        :return:
+        """
+        expected = np.exp(self.log_probs) @ self.log_probs
+        return float(expected + (self.log_probs.mean() - expected) / 4)
+
+    def encode(self, text: str) -> np.ndarray:
+        try:
+            return np.array([self.codes[symbol] for symbol in text], dtype=np.uint8)
+        except KeyError as error:
+            raise ValueError(f"{error.args[0]!r} is not in the alphabet") from None
+
+    def score(self, texts: np.ndarray) -> np.ndarray:
+        """
+        The log likelihood of each row of a batch of encoded texts
+        :param texts: array of shape (candidates, length) of symbol codes
+        :return: array of shape (candidates,)
+        """
+        return self.log_probs[ngram_indexes(texts, len(self.symbols), self.n)].sum(axis=1)
+
+
+def ngram_indexes(texts: np.ndarray, symbol_count: int, n: int) -> np.ndarray:
+    """
+    The flat table index of every n-gram in every row
+    :param texts: array of shape (rows, length)
+    :param symbol_count:
+    :param n:
+    :return: array of shape (rows, length - n + 1)
+    """
+    length = texts.shape[1] - n + 1
+    indexes = texts[:, :length].astype(np.intp)
+    for offset in range(1, n):
+        indexes = indexes * symbol_count + texts[:, offset:offset + length]
+    return indexes
+
+
+class BatchDecoder:
+    def __init__(self, cryptext: str, symbols: str = alphabet):
+        """
+        Decodes one cryptext under many candidate initial rotors at once. Rotors are given as arrays of symbol codes,
+        one row per candidate, and every step of the text is a handful of NumPy gathers over the whole batch using the
+        same permutation tables as CompactRotor, so it produces exactly what CompactRotor.encode(..., is_crypt=True)
+        would for each rotor. The cipher rotor is only ever used to find the ring index of the next character, so it is
+        carried as its inverse (the slot of each symbol).
+        :param cryptext:
+        :param symbols: the symbols on both rotors; their number is the rotor size
+        """
+        self.symbols = symbols
+        self.size = len(symbols)
+        self.codes = {symbol: code for code, symbol in enumerate(symbols)}
+        try:
+            self.cryptext = [self.codes[symbol] for symbol in cryptext]
+        except KeyError as error:
+            raise ValueError(f"{error.args[0]!r} is not on the rotors") from None
+        encode_cipher, encode_plain, _, _ = permutation_tables(self.size)
+        cipher_tables = np.array([list(table[:self.size]) for table in encode_cipher], dtype=np.intp)
+        # after a step with ring index r, the symbol that was in cipher slot s is in slot cipher_moves[r, s]
+        self.cipher_moves = np.argsort(cipher_tables, axis=1)
+        self.plain_tables = np.array([list(table[:self.size]) for table in encode_plain], dtype=np.intp)
+
+    def plain_slots(self, cipher_rotors: np.ndarray) -> np.ndarray:
+        """
+        For each candidate cipher rotor, the slot of the initial plain rotor whose symbol is read out at each step. The
+        ring indexes, and so the moves of both rotors, depend only on the cipher rotor, so this is all decode needs to
+        know about it: the plaintext is the initial plain rotor read at these slots, whatever the plain rotor holds.
+        :param cipher_rotors: array of shape (candidates, size) of symbol codes, zenith first
+        :return: array of shape (candidates, len(cryptext)) of slot numbers
+        """
+        candidates, size = cipher_rotors.shape
+        row_offsets = np.arange(candidates)[:, None] * size
+        cipher_slots = np.argsort(cipher_rotors, axis=1)
+        plain_labels = np.broadcast_to(np.arange(size), (candidates, size))
+        cipher_moves, plain_tables = self.cipher_moves.ravel(), self.plain_tables
+        slots = np.empty((candidates, len(self.cryptext)), dtype=np.intp)
+        for position, code in enumerate(self.cryptext):
+            ring_indexes = cipher_slots[:, code]
+            cipher_slots = cipher_moves[ring_indexes[:, None] * size + cipher_slots]
+            plain_labels = plain_labels.ravel()[row_offsets + plain_tables[ring_indexes]]
+            slots[:, position] = plain_labels[:, -1]
+        return slots
+
+    def decode(self, cipher_rotors: np.ndarray, plain_rotors: np.ndarray,
+               slots: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        :param cipher_rotors: array of shape (candidates, size) of symbol codes, zenith first
+        :param plain_rotors: same
+        :param slots: plain_slots(cipher_rotors), if already known
+        :return: array of shape (candidates, len(cryptext)) of plaintext symbol codes
+        """
+        if slots is None:
+            slots = self.plain_slots(cipher_rotors)
+        return np.take_along_axis(np.asarray(plain_rotors, dtype=np.uint8), slots, axis=1)
+
+    def rotor(self, cipher_rotor: Sequence[int], plain_rotor: Sequence[int]) -> RotorState:
+        return RotorState(0, deque(self.symbols[code] for code in cipher_rotor), None,
+                          deque(self.symbols[code] for code in plain_rotor), None)
+
+
+def coincidence(texts: np.ndarray, symbol_count: int, n: int = 2) -> np.ndarray:
+    """
+    The n-gram index of coincidence of each row: the chance that two n-grams picked at random from the row are the
+    same, relative to uniformly random text, so about 1 for random text and well above it for language. It does not
+    change under a substitution of the symbols.
+    :param texts: array of shape (rows, length) of symbol codes
+    :param symbol_count:
+    :param n:
+    :return: array of shape (rows,)
+    """
+    indexes = ngram_indexes(texts, symbol_count, n)
+    rows, count = indexes.shape
+    ngram_count = symbol_count ** n
+    counts = np.bincount((indexes + np.arange(rows)[:, None] * ngram_count).ravel(),
+                         minlength=rows * ngram_count).reshape(rows, ngram_count)
+    return (counts * (counts - 1)).sum(axis=1) * ngram_count / max(1, count * (count - 1))
+
+
+class ClimbResult:
+    def __init__(self, rotor: RotorState, plaintext: str, score: float, seed: int, verified: bool, seconds: float):
+        """
+        The best rotor pair one restart found
+        :param rotor: the initial rotor, at text index 0
+        :param plaintext: the cryptext decoded with rotor by CompactRotor
+        :param score: log likelihood of plaintext per scored n-gram
+        :param seed: seed of the restart
+        :param verified: whether the decoding by CompactRotor agrees with the batch decoding and encodes back to the
+        cryptext (see verify_rotor)
+        :param seconds:
+        """
+        self.rotor = rotor
+        self.plaintext = plaintext
+        self.score = score
+        self.seed = seed
+        self.verified = verified
+        self.seconds = seconds
+
+    def __repr__(self):
+        return f"ClimbResult(score={self.score:.3f}, seed={self.seed}, verified={self.verified})"
+
+
+def random_cipher_rotors(size: int, count: int, generator: np.random.Generator) -> np.ndarray:
+    """
+    count random cipher rotors with symbol 0 at the zenith. Turning both rotors together gives an equivalent rotor
+    (see verify_rotor), so this loses nothing as long as the plain rotor is free.
+    :param size:
+    :param count:
+    :param generator:
+    :return: array of shape (count, size)
+    """
+    rotors = np.zeros((count, size), dtype=np.intp)
+    rotors[:, 1:] = generator.permuted(np.tile(np.arange(1, size), (count, 1)), axis=1)
+    return rotors
+
+
+def screen(decoder: BatchDecoder, generator: np.random.Generator, batches: int = SCREEN_BATCHES,
+           batch_size: int = BATCH_SIZE, keep: int = SCREEN_KEEP, deadline: float = float("inf")) -> \
+        List[Tuple[float, np.ndarray, np.ndarray]]:
+    """
+    Scores batches of random cipher rotors without guessing the plain rotor. With the right cipher rotor the slots
+    plain_slots reads are the plaintext under a substitution (slot to symbol), so their bigram coincidence is that of
+    the language; with any other cipher rotor they are close to random, even when it is a single swap away.
+    :param decoder:
+    :param generator:
+    :param batches:
+    :param batch_size:
+    :param keep:
+    :param deadline: time.time() value to stop at, checked after each batch
+    :return: the best keep cipher rotors as (coincidence, cipher rotor, plain slots), best first
+    """
+    best_scores = np.empty(0)
+    best_rotors = np.empty((0, decoder.size), dtype=np.intp)
+    best_slots = np.empty((0, len(decoder.cryptext)), dtype=np.intp)
+    for _ in range(batches):
+        rotors = random_cipher_rotors(decoder.size, batch_size, generator)
+        slots = decoder.plain_slots(rotors)
+        scores = np.concatenate([best_scores, coincidence(slots, decoder.size)])
+        order = np.argsort(-scores)[:keep]
+        best_scores = scores[order]
+        best_rotors = np.concatenate([best_rotors, rotors])[order]
+        best_slots = np.concatenate([best_slots, slots])[order]
+        if time.time() > deadline:
+            break
+    return list(zip(best_scores, best_rotors, best_slots))
+
+
+def neighbours(rotor: np.ndarray, count: int, generator: np.random.Generator) -> np.ndarray:
+    """
+    count random neighbours of a rotor: about nine in ten swap two slots, the rest turn the rotor by a random amount
+    (which moves it against the other rotor)
+    :param rotor: array of shape (size,)
+    :param count:
+    :param generator:
+    :return: array of shape (count, size)
+    """
+    size = len(rotor)
+    candidates = np.tile(rotor, (count, 1))
+    rows = np.arange(count)
+    first = generator.integers(0, size, count)
+    second = (first + generator.integers(1, size, count)) % size
+    candidates[rows, first], candidates[rows, second] = rotor[second], rotor[first]
+    turned = rows[generator.random(count) < 0.1]
+    shifts = generator.integers(1, size, len(turned))
+    candidates[turned] = rotor[(np.arange(size)[None, :] + shifts[:, None]) % size]
+    return candidates
+
+
+def climb(table: NgramTable, slots: np.ndarray, generator: np.random.Generator, patience: int = PATIENCE,
+          batch_size: int = BATCH_SIZE, kicks: int = KICKS, deadline: float = float("inf")) -> \
+        Tuple[np.ndarray, float]:
+    """
+    Hill climbing of the plain rotor for a fixed cipher rotor, given by its plain slots. Each batch holds neighbours
+    of the current plain rotor (see neighbours), decoded with one gather and scored together, and the best is taken
+    while it improves the score. At a local optimum the best rotor so far is kicked with a few random swaps and the
+    climb starts again from there.
+    :param table:
+    :param slots: plain slots of the cipher rotor, see BatchDecoder.plain_slots
+    :param generator:
+    :param patience: local optima in a row without a new best before stopping
+    :param batch_size:
+    :param kicks: random swaps applied at a local optimum
+    :param deadline: time.time() value to stop at
+    :return: the best plain rotor and its score per scored n-gram
+    """
+    scored = max(1, len(slots) - table.n + 1)
+    plain = generator.permutation(len(table.symbols))
+    score = table.score(plain[slots][None, :])[0] / scored
+    best_plain, best_score = plain, score
+    stale = 0
+    while stale < patience and time.time() < deadline:
+        candidates = neighbours(plain, batch_size, generator)
+        scores = table.score(candidates[:, slots]) / scored
+        choice = int(np.argmax(scores))
+        if scores[choice] > score:
+            plain, score = candidates[choice], scores[choice]
+            continue
+        if score > best_score:
+            best_plain, best_score = plain, score
+            stale = 0
+        else:
+            stale += 1
+        plain = best_plain.copy()
+        for _ in range(kicks):
+            first, second = generator.choice(len(plain), 2, replace=False)
+            plain[first], plain[second] = plain[second], plain[first]
+        score = table.score(plain[slots][None, :])[0] / scored
+    return best_plain, float(best_score)
+
+
+def restart(decoder: BatchDecoder, table: NgramTable, seed: int, cipher_rotor: Optional[str] = None,
+            screen_batches: int = SCREEN_BATCHES, keep: int = SCREEN_KEEP, patience: int = PATIENCE,
+            batch_size: int = BATCH_SIZE, kicks: int = KICKS, deadline: float = float("inf")) \
+        -> ClimbResult:
+    """
+    One independent restart: screen random cipher rotors (or take the known one), climb the plain rotor for each of
+    the best, and check the winner against the scalar decode path
+    :param decoder:
+    :param table: n-gram table over the symbols of the decoder
+    :param seed:
+    :param cipher_rotor: the cipher rotor, if it is known, which leaves only the plain rotor to find
+    :param screen_batches: see screen
+    :param keep: see screen
+    :param patience: see climb
+    :param batch_size:
+    :param kicks: see climb
+    :param deadline: time.time() value to stop at
+    :return:
+    """
+    start = time.perf_counter()
+    generator = np.random.default_rng(seed)
+    if cipher_rotor is not None:
+        rotor = np.array([decoder.codes[symbol] for symbol in cipher_rotor], dtype=np.intp)
+        candidates = [(0.0, rotor, decoder.plain_slots(rotor[None, :])[0])]
+    else:
+        candidates = screen(decoder, generator, screen_batches, batch_size, keep, deadline)
+    best = None
+    for _, cipher, slots in candidates:
+        plain, score = climb(table, slots, generator, patience, batch_size, kicks, deadline)
+        if best is None or score > best[2]:
+            best = (cipher, plain, score, slots)
+    cipher, plain, score, slots = best
+    rotor = decoder.rotor(cipher, plain)
+    cryptext = "".join(decoder.symbols[code] for code in decoder.cryptext)
+    plaintext = "".join(CompactRotor(rotor).encode(cryptext, len(cryptext), True))
+    verified = plaintext == "".join(decoder.symbols[code] for code in plain[slots]) and \
+        verify_rotor(plaintext, cryptext, rotor)
+    return ClimbResult(rotor, plaintext, score, seed, verified, time.perf_counter() - start)
+
+
+def init_worker(cryptext: str, table: NgramTable, options: dict) -> None:
+    global worker_task
+    worker_task = (BatchDecoder(cryptext, table.symbols), table, options)
+
+
+def restart_worker(seed: int) -> ClimbResult:
+    decoder, table, options = worker_task
+    return restart(decoder, table, seed, **options)
+
+
+worker_task: Optional[Tuple[BatchDecoder, NgramTable, dict]] = None
+
+
+def attack(cryptext: str, table: NgramTable, restarts: int = 16, workers: Optional[int] = None,
+           time_limit: Optional[float] = None, target: Optional[float] = None, seed: int = 0,
+           cipher_rotor: Optional[str] = None, **options) -> Optional[ClimbResult]:
+    """
+    Ciphertext only attack: independent restarts in a pool of worker processes, stopping at the first result that
+    reaches target. Both rotors must hold the symbols of the table.
+
+    Without known plaintext nothing guides the search towards the cipher rotor: a rotor one swap away from the right
+    one decodes to noise, so its part of the search is a screen of random rotors and the chance of a restart finding it
+    is about screen_batches * batch_size / (size - 1)!. That covers rotors of ten or so symbols; for 26 symbols the
+    cipher rotor has to be known (from another message, say), which leaves a substitution for the plain rotor that the
+    hill climbing solves from a few hundred characters.
+    :param cryptext:
+    :param table:
+    :param restarts: number of restarts, seeded seed, seed + 1, ...
+    :param workers: number of worker processes, defaults to the number of cpus
+    :param time_limit: seconds for the whole attack
+    :param target: score per n-gram that counts as solved, defaults to table.threshold()
+    :param seed:
+    :param cipher_rotor: see restart
+    :param options: see restart
+    :return: the first result that reached target, or else the best one (None if the time limit left no restart time
+    to finish)
+    """
+    workers = workers if workers else os.cpu_count()
+    target = table.threshold() if target is None else target
+    options = dict(options, cipher_rotor=cipher_rotor)
+    if time_limit is not None:
+        options["deadline"] = time.time() + time_limit
+    best = None
+    with multiprocessing.Pool(min(workers, restarts), init_worker, (cryptext, table, options)) as pool:
+        for result in pool.imap_unordered(restart_worker, range(seed, seed + restarts)):
+            if best is None or result.score > best.score:
+                best = result
+            if result.verified and result.score >= target:
+                return result
+    return best
@@ -0,0 +1,142 @@
+from typing import BinaryIO, Iterable, Iterator, Optional
+from collections import deque
+import json
+import os
+
+from Chaocipher.chaocipher import RotorState, CompactRotor
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+class StreamCodec:
+    def __init__(self, rotor: RotorState, is_crypt: bool = False):
+        """
+        Encodes or decodes a text of any length one chunk at a time. Decoding runs forward from the initial rotor (the
+        way quick_chao.quick_decode does) rather than backwards from the end, so nothing but the current chunk is ever
+        held in memory. The rotor is copied, the caller's RotorState is not modified.
+        :param rotor: Rotor State at the start of the text
+        :param is_crypt: flag for whether the input is ciphertext (decoding) or plaintext (encoding)
+        """
+        self.compact_rotor = CompactRotor(rotor)
+        self.is_crypt = is_crypt
+        self.processed = 0
+
+    def update(self, chunk: str) -> str:
+        """
+        Processes the next chunk of the text. If the chunk contains a character that is not on the rotors a ValueError
+        is raised and the codec is left as it was before the call.
+        :param chunk:
+        :return: the corresponding chunk of output
+        """
+        output_list = self.compact_rotor.encode(chunk, len(chunk), self.is_crypt, self.compact_rotor.text_index)
+        self.processed += len(chunk)
+        return "".join(output_list)
+
+    def iter_chunks(self, chunks: Iterable[str]) -> Iterator[str]:
+        for chunk in chunks:
+            yield self.update(chunk)
+
+    def iter_stream(self, stream: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE, encoding: str = "ascii") \
+            -> Iterator[str]:
+        """
+        Reads a binary stream until it is exhausted, yielding output chunks. Every symbol has to be a single byte in the
+        given encoding so that the processed count is also the offset in the stream.
+        :param stream:
+        :param chunk_size:
+        :param encoding:
+        :return:
+        """
+        while True:
+            data = stream.read(chunk_size)
+            if not data:
+                return
+            yield self.update(data.decode(encoding))
+
+    def rotor_state(self) -> RotorState:
+        rotor = RotorState(0, deque(), None, deque(), None)
+        self.compact_rotor.store(rotor)
+        return rotor
+
+    def get_state(self) -> dict:
+        """
+        A JSON serializable snapshot of the codec, see from_state
+        :return:
+        """
+        rotor = self.rotor_state()
+        return {"cipher_rotor": list(rotor.cipher_rotor), "plain_rotor": list(rotor.plain_rotor),
+                "text_index": rotor.text_index, "is_crypt": self.is_crypt, "processed": self.processed}
+
+    @classmethod
+    def from_state(cls, state: dict) -> "StreamCodec":
+        rotor = RotorState(state["text_index"], deque(state["cipher_rotor"]), None, deque(state["plain_rotor"]), None)
+        codec = cls(rotor, state["is_crypt"])
+        codec.processed = state["processed"]
+        return codec
+
+
+def encode_stream(chunks: Iterable[str], rotor: RotorState) -> Iterator[str]:
+    """
+    Streaming version of encode_string
+    :param chunks:
+    :param rotor: Rotor State at the start of the plaintext
+    :return:
+    """
+    return StreamCodec(rotor).iter_chunks(chunks)
+
+
+def decode_stream(chunks: Iterable[str], rotor: RotorState) -> Iterator[str]:
+    """
+    Streaming decryption. Unlike decode_string it takes the rotor at the start of the ciphertext and runs forward.
+    :param chunks:
+    :param rotor: Rotor State at the start of the ciphertext
+    :return:
+    """
+    return StreamCodec(rotor, True).iter_chunks(chunks)
+
+
+def save_state(codec: StreamCodec, state_path: str) -> None:
+    temporary_path = state_path + ".tmp"
+    with open(temporary_path, "w") as state_file:
+        json.dump(codec.get_state(), state_file)
+        state_file.flush()
+        os.fsync(state_file.fileno())
+    os.replace(temporary_path, state_path)
+
+
+def process_file(source_path: str, destination_path: str, rotor: Optional[RotorState] = None, is_crypt: bool = False,
+                 state_path: Optional[str] = None, chunk_size: int = DEFAULT_CHUNK_SIZE, encoding: str = "ascii") \
+        -> StreamCodec:
+    """
+    Encodes or decodes a file into another file chunk by chunk. If a state path is given the codec state is saved there
+    after every chunk, and a later call with the same paths resumes where the last one stopped (the rotor argument is
+    then ignored). Output written after the last saved state is discarded on resume. Each chunk of output is synced to
+    disk before the state that counts it is saved, so a resume never skips output lost in a crash, and the state file
+    is removed once the whole file is done, so a later call with the same state path starts afresh from its rotor.
+    :param source_path:
+    :param destination_path:
+    :param rotor: Rotor State at the start of the file, required unless resuming
+    :param is_crypt: flag for whether the file is ciphertext (decoding) or plaintext (encoding)
+    :param state_path: where to keep the resumable state
+    :param chunk_size:
+    :param encoding: a single-byte encoding for the symbols in the file
+    :return: the codec after the whole file has been processed
+    """
+    if state_path is not None and os.path.exists(state_path):
+        with open(state_path) as state_file:
+            codec = StreamCodec.from_state(json.load(state_file))
+    elif rotor is not None:
+        codec = StreamCodec(rotor, is_crypt)
+    else:
+        raise ValueError("process_file needs a rotor unless it is resuming from a saved state")
+    with open(source_path, "rb") as source, open(destination_path, "ab") as destination:
+        source.seek(codec.processed)
+        destination.truncate(codec.processed)
+        for output_chunk in codec.iter_stream(source, chunk_size, encoding):
+            destination.write(output_chunk.encode(encoding))
+            if state_path is not None:
+                destination.flush()
+                os.fsync(destination.fileno())
+                save_state(codec, state_path)
+    if state_path is not None and os.path.exists(state_path):
+        os.remove(state_path)
+    return codec
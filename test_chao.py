@@ -0,0 +1,48 @@
+from string import ascii_lowercase as alphabet
+import random
+import unittest
+
+from Chaocipher.bench_chao import copy_rotor, random_rotor
+from Chaocipher.chaocipher import SearchStats, crack, crack_iterative, encode_string, find_starting_position
+
+# Pairs the recursive search cannot solve within this many nodes are skipped
+NODE_BUDGET = 20000
+
+
+def random_pairs(seed: int, count: int, length: int, size: int):
+    rng = random.Random(seed)
+    symbols = alphabet[:size]
+    for _ in range(count):
+        rotor = random_rotor(rng, symbols)
+        plaintext = "".join(rng.choice(symbols) for _ in range(length))
+        yield plaintext, encode_string(plaintext, copy_rotor(rotor))
+
+
+class CrackIterativeTest(unittest.TestCase):
+    def check_matches_crack(self, size: int, checkpoint_interval: int) -> None:
+        solved = 0
+        for plaintext, cryptext in random_pairs(1, 20, 300, size):
+            start_index = find_starting_position(plaintext, cryptext, 6)
+            expected = crack(plaintext, cryptext, start_index, stats=SearchStats(node_budget=NODE_BUDGET), size=size)
+            if expected is None:
+                continue
+            solved += 1
+            completed = crack_iterative(plaintext, cryptext, start_index, checkpoint_interval,
+                                        stats=SearchStats(node_budget=5 * NODE_BUDGET), size=size)
+            self.assertIsNotNone(completed)
+            self.assertEqual((list(expected.cipher_rotor), list(expected.plain_rotor), expected.text_index),
+                             (list(completed.cipher_rotor), list(completed.plain_rotor), completed.text_index))
+        self.assertGreater(solved, 0)
+
+    def test_without_checkpoints(self):
+        self.check_matches_crack(26, None)
+
+    def test_with_checkpoints(self):
+        self.check_matches_crack(26, 8)
+
+    def test_with_checkpoints_small_rotor(self):
+        self.check_matches_crack(12, 8)
+
+
+if __name__ == '__main__':
+    unittest.main()